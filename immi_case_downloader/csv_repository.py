@@ -9,11 +9,11 @@ from .storage import (
     get_case_by_id,
     update_case,
     delete_case,
+    deferred_case_writes,
     add_case_manual,
     get_case_full_text,
     get_statistics,
-    save_cases_csv,
-    save_cases_json,
+    save_all_cases,
     ensure_output_dirs,
     CASE_FIELDS,
 )
@@ -40,20 +40,22 @@ class CsvRepository:
 
     def save_many(self, cases: list[ImmigrationCase]) -> int:
         """Merge new cases with existing by URL dedup, then save."""
-        existing = load_all_cases(self.base_dir)
-        existing_urls = {c.url for c in existing}
-        added = 0
-        for case in cases:
-            case.ensure_id()
-            if case.url and case.url not in existing_urls:
-                existing.append(case)
-                existing_urls.add(case.url)
-                added += 1
-            elif not case.url:
-                existing.append(case)
-                added += 1
-        save_cases_csv(existing, self.base_dir)
-        save_cases_json(existing, self.base_dir)
+        # Read-modify-write under the storage write lock; inside
+        # deferred_writes() this joins the open batch.
+        with deferred_case_writes(self.base_dir):
+            existing = load_all_cases(self.base_dir)
+            existing_urls = {c.url for c in existing}
+            added = 0
+            for case in cases:
+                case.ensure_id()
+                if case.url and case.url not in existing_urls:
+                    existing.append(case)
+                    existing_urls.add(case.url)
+                    added += 1
+                elif not case.url:
+                    existing.append(case)
+                    added += 1
+            save_all_cases(existing, self.base_dir)
         return added
 
     def update(self, case_id: str, updates: dict) -> bool:
@@ -65,6 +67,10 @@ class CsvRepository:
     def add(self, case: ImmigrationCase) -> ImmigrationCase:
         return add_case_manual(case.to_dict(), self.base_dir)
 
+    def deferred_writes(self):
+        """Context manager batching update()/delete() into one file rewrite."""
+        return deferred_case_writes(self.base_dir)
+
     def get_statistics(self) -> dict:
         return get_statistics(self.base_dir)
 
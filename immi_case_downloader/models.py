@@ -1,10 +1,38 @@
 """Data models for immigration cases."""
 
 import hashlib
+import math
 from dataclasses import dataclass, field, asdict
 from typing import Optional
 
 
+def _is_missing(value) -> bool:
+    """True for empty values, float NaN (pandas' missing marker) and the string "nan"."""
+    if not value:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    return isinstance(value, str) and value == "nan"
+
+
+def _to_year(value) -> int:
+    """Coerce a year cell to int; 0 when missing or unparseable.
+
+    Accepts float-formatted text such as "2024.0", which pandas writes for a
+    year column that contains gaps.
+    """
+    if _is_missing(value):
+        return 0
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return int(float(value))
+    except (ValueError, TypeError, OverflowError):
+        return 0
+
+
 @dataclass
 class ImmigrationCase:
     """Represents a single immigration court/tribunal case."""
@@ -58,10 +86,7 @@ class ImmigrationCase:
         for k, v in data.items():
             if k in valid_fields:
                 if k == "year":
-                    try:
-                        filtered[k] = int(v) if v and str(v) != "nan" else 0
-                    except (ValueError, TypeError):
-                        filtered[k] = 0
+                    filtered[k] = _to_year(v)
                 else:
-                    filtered[k] = str(v) if v and str(v) != "nan" else ""
+                    filtered[k] = "" if _is_missing(v) else str(v)
         return cls(**filtered)
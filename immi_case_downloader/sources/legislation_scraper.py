@@ -15,8 +15,10 @@ from datetime import datetime, timezone
 from typing import Callable
 from urllib.parse import urljoin
 
+import requests
 from bs4 import BeautifulSoup, Tag
 
+from ..config import REQUEST_DELAY
 from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -86,9 +88,36 @@ KNOWN_LAWS: dict[str, dict] = {
     # AustLII has permanently removed it (HTTP 410). Use ARTA 2024 for current law.
 }
 
+# Last-amended date patterns, tried in order (compiled once at module load)
+_LAST_AMENDED_PATTERNS = [
+    re.compile(r"as amended to[:\s]+(\d{1,2}\s+\w+\s+\d{4})", re.IGNORECASE),
+    re.compile(r"amended to[:\s]+(\d{1,2}\s+\w+\s+\d{4})", re.IGNORECASE),
+    re.compile(r"authoritative version as at[:\s]+(\d{1,2}\s+\w+\s+\d{4})", re.IGNORECASE),
+    re.compile(r"as at[:\s]+(\d{1,2}\s+\w+\s+\d{4})", re.IGNORECASE),
+    re.compile(r"updated[:\s]+(\d{4}-\d{2}-\d{2})", re.IGNORECASE),
+]
+
+# TOC parsing patterns
+_WHITESPACE_RE = re.compile(r"\s+")
+_PART_HEADING_RE = re.compile(r"^Part\s+", re.IGNORECASE)
+_DIVISION_HEADING_RE = re.compile(r"^(Division|Subdivision)\s+", re.IGNORECASE)
+# Section pages end in s{digit}.html (e.g. s1.html, s501a.html)
+# Regulations use dot-notation: s1.03.html, s1.05a.html
+# Excludes schedules (sch1.html) by requiring digit after 's'
+_SECTION_HREF_RE = re.compile(r"(s\d[\d.a-zA-Z]*\.html)$", re.IGNORECASE)
+# AustLII links look like "1  Short title" or "501  Character test"
+_SECTION_LINK_TEXT_RE = re.compile(r"^([\d]+[A-Za-z]?)\s+(.*)")
+
+# Section text clean-up patterns
+_INTERNAL_ANCHOR_RE = re.compile(r"^#")
+_EXCESS_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
 # Type alias for progress callback
 ProgressCallback = Callable[[str, int, int, str], None]
 
+# Type alias for an injected page fetcher: url -> response (or None on failure)
+Fetcher = Callable[[str], requests.Response | None]
+
 
 @dataclass
 class SectionLink:
@@ -105,6 +134,16 @@ class SectionLink:
 class LegislationScraper(BaseScraper):
     """Scrapes Commonwealth legislation section-by-section from AustLII."""
 
+    def __init__(self, delay: float = REQUEST_DELAY, fetcher: Fetcher | None = None):
+        """
+        Args:
+            delay: Minimum seconds between HTTP requests.
+            fetcher: Optional replacement for ``BaseScraper.fetch`` used for
+                     TOC and section pages (e.g. a canned response queue).
+        """
+        super().__init__(delay=delay)
+        self._fetcher = fetcher
+
     # ── Public API ────────────────────────────────────────────────────────
 
     def scrape_all(
@@ -156,7 +195,7 @@ class LegislationScraper(BaseScraper):
         toc_url = f"{AUSTLII_LEGIS_BASE}/{meta['austlii_id']}/"
 
         logger.info(f"Fetching TOC: {toc_url}")
-        response = self.fetch(toc_url)
+        response = self._get(toc_url)
         if not response:
             logger.error(f"Failed to fetch TOC for {law_id} at {toc_url}")
             return None
@@ -180,6 +219,12 @@ class LegislationScraper(BaseScraper):
             "sections": sections,
         }
 
+    def _get(self, url: str) -> requests.Response | None:
+        """Fetch a page via the injected fetcher, or BaseScraper.fetch by default."""
+        if self._fetcher is not None:
+            return self._fetcher(url)
+        return self.fetch(url)
+
     # ── TOC Parsing ───────────────────────────────────────────────────────
 
     def _parse_toc(self, html: str, base_url: str) -> list[SectionLink]:
@@ -190,6 +235,7 @@ class LegislationScraper(BaseScraper):
         """
         soup = BeautifulSoup(html, "lxml")
         links: list[SectionLink] = []
+        seen_ids: set[str] = set()
         current_part = ""
         current_division = ""
 
@@ -217,12 +263,12 @@ class LegislationScraper(BaseScraper):
             # ── Track structural headings ────────────────────────────────
             if tag in ("h1", "h2", "h3", "h4", "b", "strong"):
                 text = elem.get_text(" ", strip=True)
-                text_clean = re.sub(r"\s+", " ", text).strip()
+                text_clean = _WHITESPACE_RE.sub(" ", text).strip()
 
-                if re.match(r"^Part\s+", text_clean, re.IGNORECASE):
+                if _PART_HEADING_RE.match(text_clean):
                     current_part = text_clean
                     current_division = ""  # New Part resets Division
-                elif re.match(r"^(Division|Subdivision)\s+", text_clean, re.IGNORECASE):
+                elif _DIVISION_HEADING_RE.match(text_clean):
                     current_division = text_clean
 
             # ── Collect section links ────────────────────────────────────
@@ -235,16 +281,12 @@ class LegislationScraper(BaseScraper):
             if not href:
                 continue
 
-            # Section pages end in s{digit}.html (e.g. s1.html, s501a.html)
-            # Regulations use dot-notation: s1.03.html, s1.05a.html
-            # Excludes schedules (sch1.html) by requiring digit after 's'
-            m = re.match(r"(s\d[\d.a-zA-Z]*\.html)$", href, re.IGNORECASE)
+            m = _SECTION_HREF_RE.match(href)
             if not m:
                 continue
 
             link_text = elem.get_text(" ", strip=True)
-            # AustLII links look like "1  Short title" or "501  Character test"
-            num_match = re.match(r"^([\d]+[A-Za-z]?)\s+(.*)", link_text)
+            num_match = _SECTION_LINK_TEXT_RE.match(link_text)
             if num_match:
                 number = num_match.group(1)
                 title = num_match.group(2).strip()
@@ -256,8 +298,9 @@ class LegislationScraper(BaseScraper):
             full_url = href if href.startswith("http") else urljoin(base_url, href)
 
             # Avoid duplicate section IDs (some TOC pages link same section twice)
-            if any(lk.section_id == section_id for lk in links):
+            if section_id in seen_ids:
                 continue
+            seen_ids.add(section_id)
 
             links.append(SectionLink(
                 section_id=section_id,
@@ -278,15 +321,8 @@ class LegislationScraper(BaseScraper):
           "Series as amended to 1 December 2025"
           "Authoritative version as at 15 November 2025"
         """
-        patterns = [
-            r"as amended to[:\s]+(\d{1,2}\s+\w+\s+\d{4})",
-            r"amended to[:\s]+(\d{1,2}\s+\w+\s+\d{4})",
-            r"authoritative version as at[:\s]+(\d{1,2}\s+\w+\s+\d{4})",
-            r"as at[:\s]+(\d{1,2}\s+\w+\s+\d{4})",
-            r"updated[:\s]+(\d{4}-\d{2}-\d{2})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _LAST_AMENDED_PATTERNS:
+            match = pattern.search(html)
             if match:
                 return match.group(1).strip()
         return ""
@@ -307,7 +343,7 @@ class LegislationScraper(BaseScraper):
             if progress_callback:
                 progress_callback(law_id, i, total, link.section_id)
 
-            response = self.fetch(link.url)
+            response = self._get(link.url)
             if not response:
                 logger.warning(f"Failed to fetch {link.section_id} ({link.url})")
                 text = "[Section text could not be loaded]"
@@ -352,12 +388,12 @@ class LegislationScraper(BaseScraper):
 
         if content:
             # Unwrap internal anchor links (keep text, remove <a> wrapper)
-            for anchor in content.find_all("a", href=re.compile(r"^#")):
+            for anchor in content.find_all("a", href=_INTERNAL_ANCHOR_RE):
                 anchor.unwrap()
             text = content.get_text(separator="\n", strip=True)
         else:
             text = soup.get_text(separator="\n", strip=True)
 
         # Normalise whitespace: collapse 3+ consecutive blank lines to 2
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _EXCESS_BLANK_LINES_RE.sub("\n\n", text)
         return text.strip()
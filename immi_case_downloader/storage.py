@@ -1,20 +1,48 @@
 """Storage and export utilities for immigration cases."""
 
+import copy
 import csv
+import functools
+import io
 import json
 import os
 import logging
+import operator
+import re
+import stat
+import tempfile
 import time
 import threading
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
+from typing import BinaryIO, Callable
 
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # in requirements.txt; stdlib json covers bare installs
+    orjson = None
+
 from .config import OUTPUT_DIR, CASES_CSV, CASES_JSON, TEXT_CASES_DIR
-from .models import ImmigrationCase
+from .models import ImmigrationCase, _to_year
 
 logger = logging.getLogger(__name__)
 
+
+# One "_" per character outside word characters and " -[]" (existing text
+# files on disk were named this way, so characters are not collapsed).
+_UNSAFE_FILENAME_CHAR_RE = re.compile(r"[^\w \-\[\]]")
+
+
+def _dumps_json(data) -> bytes:
+    """Encode *data* as indented UTF-8 JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 CASE_FIELDS = [
     "case_id",
     "citation",
@@ -49,33 +77,116 @@ CASE_FIELDS = [
     "legal_test_applied",
 ]
 
+# Built once at import: a C-level getter for a case's row values in column
+# order, and the column names as a set for O(1) membership tests.
+_CASE_FIELDS_GETTER = operator.attrgetter(*CASE_FIELDS)
+_CASE_FIELDS_SET = frozenset(CASE_FIELDS)
+
+
+# os.umask can only be read by setting it, which is not thread-safe, so
+# read it once at import.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _copy_file_mode(fd: int, filepath: str) -> None:
+    """Give temp file *fd* the permissions of *filepath*.
+
+    mkstemp creates files as 0600, which would silently tighten the
+    permissions of every file replaced through it. New files get the
+    mode open() would have given them (0666 minus the umask).
+    """
+    if not hasattr(os, "fchmod"):  # not available on Windows
+        return
+    try:
+        mode = stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.fchmod(fd, mode)
+
+
+def _atomic_write(filepath: str, write: Callable[[BinaryIO], object], durable: bool = True) -> None:
+    """Atomically replace *filepath* with what ``write(f)`` writes to a binary file.
+
+    The content goes to a uniquely named temp file next to *filepath*, is
+    fsynced, then renamed over the target; the parent directory is fsynced
+    afterwards so the rename itself survives a power loss. Unique temp names
+    keep concurrent writers of the same file from clobbering each other's
+    half-written data. With ``durable=False`` both fsyncs are skipped:
+    the write stays atomic (safe against a killed process) but not against
+    power loss. On failure the temp file is removed and the original file
+    is left untouched.
+    """
+    directory, name = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            _copy_file_mode(f.fileno(), filepath)
+            write(f)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if durable and hasattr(os, "O_DIRECTORY"):  # not available on Windows
+        dir_fd = os.open(os.path.dirname(filepath) or ".", os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 
 def ensure_output_dirs(base_dir: str = OUTPUT_DIR):
     """Create output directory structure."""
     Path(base_dir).mkdir(parents=True, exist_ok=True)
     Path(base_dir, TEXT_CASES_DIR).mkdir(parents=True, exist_ok=True)
+    _resolve_base.cache_clear()
     return base_dir
 
 
-def save_cases_csv(cases: list[ImmigrationCase], base_dir: str = OUTPUT_DIR):
-    """Save cases to a CSV file using atomic write (write-tmp-then-rename)."""
-    filepath = os.path.join(base_dir, CASES_CSV)
-    tmp_path = filepath + ".tmp"
-    rows = [case.to_dict() for case in cases]
+def _write_cases_csv(f: BinaryIO, cases: list[ImmigrationCase]) -> None:
+    """Stream *cases* as CSV rows into binary file *f*.
+
+    Rows go straight from the objects to the file, without an intermediate
+    DataFrame; the format matches what ``DataFrame.to_csv`` produced
+    (UTF-8 with BOM, minimal quoting, ``os.linesep`` line endings).
+    """
+    text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+    writer = csv.writer(text, lineterminator=os.linesep)
+    writer.writerow(CASE_FIELDS)
+    writer.writerows(map(_CASE_FIELDS_GETTER, cases))
+    text.flush()
+    text.detach()  # leave *f* open for the caller
+
+
+def save_cases_csv(
+    cases: list[ImmigrationCase], base_dir: str = OUTPUT_DIR, durable: bool = True
+):
+    """Save cases to a CSV file using atomic write (write-tmp-then-rename).
 
-    df = pd.DataFrame(rows, columns=CASE_FIELDS)
-    df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
-    os.replace(tmp_path, filepath)
+    Pass ``durable=False`` for intermediate snapshots that a later write
+    supersedes; it skips the fsyncs but keeps the write atomic.
+    """
+    filepath = os.path.join(base_dir, CASES_CSV)
+    _atomic_write(filepath, lambda f: _write_cases_csv(f, cases), durable)
 
     invalidate_cases_cache()
     logger.info(f"Saved {len(cases)} cases to {filepath}")
     return filepath
 
 
-def save_cases_json(cases: list[ImmigrationCase], base_dir: str = OUTPUT_DIR):
-    """Save cases to a JSON file using atomic write (write-tmp-then-rename)."""
+def save_cases_json(
+    cases: list[ImmigrationCase], base_dir: str = OUTPUT_DIR, durable: bool = True
+):
+    """Save cases to a JSON file using atomic write (write-tmp-then-rename).
+
+    ``durable`` has the same meaning as in :func:`save_cases_csv`.
+    """
     filepath = os.path.join(base_dir, CASES_JSON)
-    tmp_path = filepath + ".tmp"
     data = {
         "total_cases": len(cases),
         "courts": list({c.court for c in cases if c.court}),
@@ -86,9 +197,7 @@ def save_cases_json(cases: list[ImmigrationCase], base_dir: str = OUTPUT_DIR):
         "cases": [case.to_dict() for case in cases],
     }
 
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    os.replace(tmp_path, filepath)
+    _atomic_write(filepath, lambda f: f.write(_dumps_json(data)), durable)
 
     logger.info(f"Saved {len(cases)} cases to {filepath}")
     return filepath
@@ -108,7 +217,7 @@ def save_case_text(
     # Create filename from citation or case ID
     filename = case.citation or case.case_id or case.title
     # Sanitize filename
-    filename = "".join(c if c.isalnum() or c in " -_[]" else "_" for c in filename)
+    filename = _UNSAFE_FILENAME_CHAR_RE.sub("_", filename)
     filename = filename.strip()[:100]
     if not filename:
         filename = f"case_{hash(case.url) % 100000}"
@@ -135,7 +244,12 @@ def load_cases_csv(base_dir: str = OUTPUT_DIR) -> list[dict]:
     if not os.path.exists(filepath):
         return []
 
-    df = pd.read_csv(filepath, encoding="utf-8-sig", dtype={"visa_subclass": str})
+    # Every column is read as plain text with NA detection off: no per-column
+    # dtype inference or NaN scan, and empty cells come back as "" (which
+    # ImmigrationCase.from_dict already treats as missing).
+    df = pd.read_csv(
+        filepath, encoding="utf-8-sig", dtype=str, keep_default_na=False, na_filter=False
+    )
     return df.to_dict("records")
 
 
@@ -189,54 +303,198 @@ def generate_summary_report(cases: list[ImmigrationCase], base_dir: str = OUTPUT
 
 # ── Simple TTL cache for load_all_cases ─────────────────────────────────────
 
-_cases_cache: dict = {"cases": None, "base_dir": None, "ts": 0.0}
+_cases_cache: dict = {"cases": None, "index": None, "base_dir": None, "ts": 0.0, "stamp": None}
 _cases_cache_lock = threading.Lock()
 _CACHE_TTL = 60.0  # seconds — matched to API-level cache
 
 
+def _csv_stamp(base_dir: str) -> tuple[int, int] | None:
+    """(mtime_ns, size) of the cases CSV, or None when it does not exist."""
+    try:
+        st = os.stat(os.path.join(base_dir, CASES_CSV))
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def invalidate_cases_cache():
     """Explicitly clear the cases cache (call after writes)."""
     with _cases_cache_lock:
         _cases_cache["cases"] = None
+        _cases_cache["index"] = None
         _cases_cache["ts"] = 0.0
+        _cases_cache["stamp"] = None
 
 
-def load_all_cases(base_dir: str = OUTPUT_DIR) -> list[ImmigrationCase]:
-    """Load all cases from CSV as ImmigrationCase objects.
+_CASE_DEFAULTS = ImmigrationCase().__dict__
+
+
+def _cases_from_records(records: list[dict]) -> list[ImmigrationCase]:
+    """Build cases from load_cases_csv() records (all values are strings).
+
+    Rows whose columns are all known fields skip ``ImmigrationCase.from_dict``
+    and ``__init__``: defaults are copied, the row laid over them and only
+    ``year`` converted. Unknown columns or stringified NaN ("nan", as left by
+    older exports) take the general from_dict path.
+    """
+    fast = not records or records[0].keys() <= _CASE_DEFAULTS.keys()
+    new_case = ImmigrationCase.__new__
+
+    cases = []
+    for r in records:
+        if fast and "nan" not in r.values():
+            attrs = dict(_CASE_DEFAULTS)
+            attrs.update(r)
+            attrs["year"] = _to_year(attrs["year"])
+            case = new_case(ImmigrationCase)
+            case.__dict__ = attrs
+        else:
+            case = ImmigrationCase.from_dict(r)
+        case.ensure_id()
+        cases.append(case)
+    return cases
+
+
+def _load_cases_cached(base_dir: str) -> tuple[list[ImmigrationCase], dict[str, ImmigrationCase]]:
+    """Return the cached (cases, case_id index) for *base_dir*, loading if stale.
 
-    Results are cached for up to _CACHE_TTL seconds. The cache is also
-    automatically invalidated when save_cases_csv() is called.
+    Both are shared with the cache; callers must not mutate the containers.
+    Inside :func:`deferred_case_writes` on the same thread, the batch's
+    working copy is returned instead so reads see the pending writes.
     """
+    batch = _active_batch(base_dir)
+    if batch is not None:
+        return batch["cases"], batch["index"]
+
     now = time.monotonic()
+    stamp = _csv_stamp(base_dir)
     with _cases_cache_lock:
         if (
             _cases_cache["cases"] is not None
             and _cases_cache["base_dir"] == base_dir
+            and _cases_cache["stamp"] == stamp
             and (now - _cases_cache["ts"]) < _CACHE_TTL
         ):
-            return list(_cases_cache["cases"])  # return a copy
+            return _cases_cache["cases"], _cases_cache["index"]
 
-    records = load_cases_csv(base_dir)
-    cases = []
-    for r in records:
-        case = ImmigrationCase.from_dict(r)
-        case.ensure_id()
-        cases.append(case)
+    cases = _cases_from_records(load_cases_csv(base_dir))
+    index: dict[str, ImmigrationCase] = {}
+    for case in cases:
+        index.setdefault(case.case_id, case)  # first row wins, as a linear scan would
 
     with _cases_cache_lock:
         _cases_cache["cases"] = cases
+        _cases_cache["index"] = index
         _cases_cache["base_dir"] = base_dir
         _cases_cache["ts"] = now
+        _cases_cache["stamp"] = stamp
+
+    return cases, index
+
+
+# ── Deferred writes for update_case / delete_case ──────────────────────────
+
+_write_batches = threading.local()
+# Serialises read-modify-write of the case files across threads, so a batch
+# cannot save over rows another writer changed or deleted meanwhile.
+# Re-entrant so mutations inside a batch on the same thread don't block.
+_case_writes_lock = threading.RLock()
+
+
+def _active_batch(base_dir: str) -> dict | None:
+    batches = getattr(_write_batches, "by_dir", None)
+    return batches.get(base_dir) if batches else None
+
 
+def _own_batch_case(batch: dict, case: ImmigrationCase) -> ImmigrationCase:
+    """Return the batch's private copy of *case*, copying it on first edit.
+
+    The batch starts out sharing case objects with ``_cases_cache``, so
+    editing them in place would expose unsaved changes to other threads.
+    """
+    if id(case) in batch["owned"]:
+        return case
+    positions = batch["positions"]
+    if positions is None:
+        positions = batch["positions"] = {id(c): i for i, c in enumerate(batch["cases"])}
+    own = copy.copy(case)
+    batch["cases"][positions.pop(id(case))] = own
+    batch["index"][case.case_id] = own
+    batch["owned"].add(id(own))
+    return own
+
+
+@contextmanager
+def deferred_case_writes(base_dir: str = OUTPUT_DIR):
+    """Coalesce case-file persistence into one write on exit.
+
+    Each mutation otherwise rewrites the whole CSV and JSON. Within the
+    block (on the calling thread) update_case, delete_case,
+    add_case_manual and save_all_cases apply to a working copy that
+    reads also see; other threads keep reading the saved cases until it
+    is saved once when the block exits, including on error, so earlier
+    mutations persist just as they would unbatched. Other writers wait
+    for the block to finish. Nested blocks for the same directory join
+    the outer one.
+    """
+    batches = getattr(_write_batches, "by_dir", None)
+    if batches is None:
+        batches = _write_batches.by_dir = {}
+    if base_dir in batches:
+        yield
+        return
+
+    with _case_writes_lock:
+        cases, index = _load_cases_cached(base_dir)
+        batches[base_dir] = {
+            "cases": list(cases),
+            "index": dict(index),
+            "owned": set(),  # ids of case objects the batch has copied or added
+            "positions": None,  # id(case) -> list position, built on first edit
+            "dirty": False,
+        }
+        try:
+            yield
+        finally:
+            batch = batches.pop(base_dir)
+            if batch["dirty"]:
+                save_cases_csv(batch["cases"], base_dir)
+                save_cases_json(batch["cases"], base_dir)
+
+
+def save_all_cases(cases: list[ImmigrationCase], base_dir: str = OUTPUT_DIR) -> None:
+    """Persist *cases* as the complete case list (CSV and JSON).
+
+    Inside :func:`deferred_case_writes` on this thread, the list replaces
+    the batch's working copy instead and is written when the block exits.
+    """
+    batch = _active_batch(base_dir)
+    if batch is None:
+        save_cases_csv(cases, base_dir)
+        save_cases_json(cases, base_dir)
+        return
+    index: dict[str, ImmigrationCase] = {}
+    for case in cases:
+        index.setdefault(case.case_id, case)
+    batch.update(cases=list(cases), index=index, positions=None, dirty=True)
+
+
+def load_all_cases(base_dir: str = OUTPUT_DIR) -> list[ImmigrationCase]:
+    """Load all cases from CSV as ImmigrationCase objects.
+
+    Results are cached for up to _CACHE_TTL seconds, and only while the
+    CSV's mtime and size are unchanged, so writes from other processes are
+    picked up on the next call. The cache is also automatically
+    invalidated when save_cases_csv() is called.
+    """
+    cases, _ = _load_cases_cached(base_dir)
     return list(cases)  # return a copy
 
 
 def get_case_by_id(case_id: str, base_dir: str = OUTPUT_DIR) -> ImmigrationCase | None:
     """Find a single case by its case_id."""
-    for case in load_all_cases(base_dir):
-        if case.case_id == case_id:
-            return case
-    return None
+    _, index = _load_cases_cached(base_dir)
+    return index.get(case_id)
 
 
 # Fields that can be updated via the web interface.
@@ -246,6 +504,8 @@ ALLOWED_UPDATE_FIELDS = frozenset({
     "judges", "catchwords", "outcome", "visa_type", "legislation",
     "text_snippet", "user_notes", "tags", "case_nature", "legal_concepts",
 })
+# Whitelist restricted to real columns, so update_case needs one membership test.
+_UPDATABLE_FIELDS = ALLOWED_UPDATE_FIELDS & _CASE_FIELDS_SET
 
 
 def update_case(case_id: str, updates: dict, base_dir: str = OUTPUT_DIR) -> bool:
@@ -253,28 +513,42 @@ def update_case(case_id: str, updates: dict, base_dir: str = OUTPUT_DIR) -> bool
 
     Only fields in ALLOWED_UPDATE_FIELDS can be modified (CWE-915 prevention).
     """
-    cases = load_all_cases(base_dir)
-    for case in cases:
-        if case.case_id == case_id:
-            for key, value in updates.items():
-                if key in ALLOWED_UPDATE_FIELDS and hasattr(case, key):
-                    setattr(case, key, value)
+    with _case_writes_lock:
+        cases, index = _load_cases_cached(base_dir)
+        case = index.get(case_id)
+        if case is None:
+            return False
+        batch = _active_batch(base_dir)
+        if batch is not None:
+            case = _own_batch_case(batch, case)
+        clean = {key: value for key, value in updates.items() if key in _UPDATABLE_FIELDS}
+        for key, value in clean.items():
+            setattr(case, key, value)
+        if batch is not None:
+            batch["dirty"] = True
+        else:
             save_cases_csv(cases, base_dir)
             save_cases_json(cases, base_dir)
-            return True
-    return False
+    return True
 
 
 def delete_case(case_id: str, base_dir: str = OUTPUT_DIR) -> bool:
     """Delete a case by its case_id."""
-    cases = load_all_cases(base_dir)
-    original_len = len(cases)
-    cases = [c for c in cases if c.case_id != case_id]
-    if len(cases) < original_len:
-        save_cases_csv(cases, base_dir)
-        save_cases_json(cases, base_dir)
-        return True
-    return False
+    with _case_writes_lock:
+        cases, index = _load_cases_cached(base_dir)
+        if case_id not in index:
+            return False
+        remaining = [c for c in cases if c.case_id != case_id]
+        batch = _active_batch(base_dir)
+        if batch is not None:
+            batch["cases"] = remaining
+            batch["positions"] = None
+            del batch["index"][case_id]
+            batch["dirty"] = True
+        else:
+            save_cases_csv(remaining, base_dir)
+            save_cases_json(remaining, base_dir)
+    return True
 
 
 def add_case_manual(case_data: dict, base_dir: str = OUTPUT_DIR) -> ImmigrationCase:
@@ -283,14 +557,29 @@ def add_case_manual(case_data: dict, base_dir: str = OUTPUT_DIR) -> ImmigrationC
     case.source = case.source or "Manual Entry"
     case.ensure_id()
 
-    cases = load_all_cases(base_dir)
-    cases.append(case)
-    ensure_output_dirs(base_dir)
-    save_cases_csv(cases, base_dir)
-    save_cases_json(cases, base_dir)
+    with _case_writes_lock:
+        cases = load_all_cases(base_dir)
+        cases.append(case)
+        ensure_output_dirs(base_dir)
+        save_all_cases(cases, base_dir)
     return case
 
 
+# Relative paths are anchored to the project root (not CWD) so
+# get_case_full_text works regardless of where the server was started from.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_base(base_dir: str) -> str:
+    """Return the resolved *base_dir* with a trailing separator.
+
+    The output dir is process-static, so its realpath (one readlink per
+    component) is memoised; ensure_output_dirs clears the cache.
+    """
+    return os.path.realpath(os.path.join(_PROJECT_ROOT, base_dir)) + os.sep
+
+
 def get_case_full_text(case: ImmigrationCase, base_dir: str = OUTPUT_DIR) -> str | None:
     """Read the full text file for a case.
 
@@ -299,22 +588,15 @@ def get_case_full_text(case: ImmigrationCase, base_dir: str = OUTPUT_DIR) -> str
     """
     if not case.full_text_path:
         return None
+    # A NUL byte would be truncated by C-level path APIs; never resolve it.
+    if "\0" in case.full_text_path:
+        logger.warning("Path with NUL byte blocked: %r", case.full_text_path)
+        return None
 
-    # Anchor relative paths to the project root (not CWD) so the function
-    # works regardless of where the server process was started from.
-    _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-    path = case.full_text_path
-    if not os.path.isabs(path):
-        path = os.path.join(_project_root, path)
-
-    abs_base = base_dir
-    if not os.path.isabs(abs_base):
-        abs_base = os.path.join(_project_root, abs_base)
-
-    resolved = os.path.realpath(path)
-    allowed_dir = os.path.realpath(abs_base)
-    if not resolved.startswith(allowed_dir + os.sep) and resolved != allowed_dir:
+    # os.path.join keeps absolute paths as-is and anchors relative ones.
+    resolved = os.path.realpath(os.path.join(_PROJECT_ROOT, case.full_text_path))
+    # The trailing separator keeps sibling dirs like "<base>_evil" outside.
+    if not resolved.startswith(_resolve_base(base_dir)):
         logger.warning("Path traversal attempt blocked: %s", case.full_text_path)
         return None
 
@@ -327,40 +609,22 @@ def get_case_full_text(case: ImmigrationCase, base_dir: str = OUTPUT_DIR) -> str
 def get_statistics(base_dir: str = OUTPUT_DIR) -> dict:
     """Compute dashboard statistics."""
     cases = load_all_cases(base_dir)
-    by_court: dict[str, int] = {}
-    by_year: dict[int, int] = {}
-    by_nature: dict[str, int] = {}
-    by_visa_subclass: dict[str, int] = {}
-    by_source: dict[str, int] = {}
-    visa_types: set[str] = set()
-    with_text = 0
-
-    for c in cases:
-        by_court[c.court_code or "Unknown"] = by_court.get(c.court_code or "Unknown", 0) + 1
-        if c.year:
-            by_year[c.year] = by_year.get(c.year, 0) + 1
-        if c.visa_type:
-            visa_types.add(c.visa_type)
-        if c.case_nature:
-            by_nature[c.case_nature] = by_nature.get(c.case_nature, 0) + 1
-        if c.visa_subclass:
-            by_visa_subclass[c.visa_subclass] = by_visa_subclass.get(c.visa_subclass, 0) + 1
-        src = c.source or "Unknown"
-        by_source[src] = by_source.get(src, 0) + 1
-        if c.full_text_path:
-            with_text += 1
-
-    # Sort visa subclasses by count descending, top 20
-    sorted_subclasses = dict(sorted(by_visa_subclass.items(), key=lambda x: x[1], reverse=True)[:20])
+    # Counter's counting loop runs in C; most_common() sorts by count
+    # descending and keeps first-seen order for ties.
+    by_court = Counter(c.court_code or "Unknown" for c in cases)
+    by_year = Counter(c.year for c in cases if c.year)
+    by_nature = Counter(c.case_nature for c in cases if c.case_nature)
+    by_visa_subclass = Counter(c.visa_subclass for c in cases if c.visa_subclass)
+    by_source = Counter(c.source or "Unknown" for c in cases)
 
     return {
         "total": len(cases),
         "by_court": dict(sorted(by_court.items())),
         "by_year": dict(sorted(by_year.items())),
-        "by_nature": dict(sorted(by_nature.items(), key=lambda x: x[1], reverse=True)),
-        "by_visa_subclass": sorted_subclasses,
-        "by_source": dict(sorted(by_source.items(), key=lambda x: x[1], reverse=True)),
-        "visa_types": sorted(visa_types),
-        "with_full_text": with_text,
+        "by_nature": dict(by_nature.most_common()),
+        "by_visa_subclass": dict(by_visa_subclass.most_common(20)),
+        "by_source": dict(by_source.most_common()),
+        "visa_types": sorted({c.visa_type for c in cases if c.visa_type}),
+        "with_full_text": sum(1 for c in cases if c.full_text_path),
         "sources": sorted({c.source for c in cases if c.source}),
     }
@@ -37,27 +37,33 @@ def error_response(msg: str, status: int = 400):
 
 def safe_int(value, default: int = 0, min_val: int | None = None, max_val: int | None = None) -> int:
     """Safely convert value to int with bounds clamping."""
-    try:
-        result = int(value)
-    except (TypeError, ValueError):
-        result = default
-    if min_val is not None:
-        result = max(result, min_val)
-    if max_val is not None:
-        result = min(result, max_val)
+    if type(value) is int:
+        result = value
+    else:
+        try:
+            result = int(value)
+        except (TypeError, ValueError):
+            result = default
+    if min_val is not None and result < min_val:
+        result = min_val
+    if max_val is not None and result > max_val:
+        result = max_val
     return result
 
 
 def safe_float(value, default: float = 0.0, min_val: float | None = None, max_val: float | None = None) -> float:
     """Safely convert value to float with bounds clamping."""
-    try:
-        result = float(value)
-    except (TypeError, ValueError):
-        result = default
-    if min_val is not None:
-        result = max(result, min_val)
-    if max_val is not None:
-        result = min(result, max_val)
+    if type(value) is float:
+        result = value
+    else:
+        try:
+            result = float(value)
+        except (TypeError, ValueError):
+            result = default
+    if min_val is not None and result < min_val:
+        result = min_val
+    if max_val is not None and result > max_val:
+        result = max_val
     return result
 
 
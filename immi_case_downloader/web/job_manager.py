@@ -14,6 +14,21 @@ from typing import Any, Callable
 
 StateFactory = Callable[[], dict[str, Any]]
 
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _copy_value(value: Any) -> Any:
+    """Independent copy of one state value, cheap for the common shapes.
+
+    Job state is scalars plus lists of scalars (messages, law ids); those
+    are copied directly and anything else falls back to ``deepcopy``.
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if type(value) is list and all(isinstance(item, _SCALAR_TYPES) for item in value):
+        return value.copy()
+    return deepcopy(value)
+
 
 class JobManager:
     """Manage a mutable job-status mapping behind an explicit lock.
@@ -54,8 +69,10 @@ class JobManager:
             return True
 
     def snapshot(self) -> dict[str, Any]:
+        # Status endpoints are polled continuously, so keep the time spent
+        # holding the lock (and blocking job progress updates) short.
         with self._lock:
-            return deepcopy(self._state)
+            return {key: _copy_value(value) for key, value in self._state.items()}
 
     def is_running(self) -> bool:
         with self._lock:
@@ -20,6 +20,7 @@ import base64
 import logging
 import time
 import threading
+from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from typing import Any
 
@@ -1030,31 +1031,34 @@ def batch_cases():
     if len(ids) > MAX_BATCH_SIZE:
         return _error(f"Batch limited to {MAX_BATCH_SIZE} cases")
 
-    repo = get_repo()
-    count = 0
-
     if action == "tag":
         tag = (data.get("tag") or "").strip().replace(",", "").replace("<", "").replace(">", "")
         if not tag:
             return _error("No tag provided")
         if len(tag) > MAX_TAG_LENGTH:
             return _error(f"Tag must be {MAX_TAG_LENGTH} characters or less")
-        for cid in ids:
-            case = repo.get_by_id(cid)
-            if case:
-                existing = {t.strip() for t in case.tags.split(",") if t.strip()} if case.tags else set()
-                if tag not in existing:
-                    existing.add(tag)
-                    repo.update(cid, {"tags": ", ".join(sorted(existing))})
-                    count += 1
+    elif action != "delete":
+        return _error(f"Unknown action: {action}")
 
-    elif action == "delete":
-        for cid in ids:
-            if repo.delete(cid):
-                count += 1
+    repo = get_repo()
+    count = 0
 
-    else:
-        return _error(f"Unknown action: {action}")
+    # Backends that persist by rewriting whole files (CSV) coalesce the
+    # per-case writes below into one; others write each change directly.
+    with getattr(repo, "deferred_writes", nullcontext)():
+        if action == "tag":
+            for cid in ids:
+                case = repo.get_by_id(cid)
+                if case:
+                    existing = {t.strip() for t in case.tags.split(",") if t.strip()} if case.tags else set()
+                    if tag not in existing:
+                        existing.add(tag)
+                        repo.update(cid, {"tags": ", ".join(sorted(existing))})
+                        count += 1
+        else:
+            for cid in ids:
+                if repo.delete(cid):
+                    count += 1
 
     if count > 0:
         _api._invalidate_cases_cache()
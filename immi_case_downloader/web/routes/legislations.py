@@ -28,6 +28,23 @@ logger = logging.getLogger(__name__)
 
 legislations_bp = Blueprint("legislations", __name__, url_prefix="/api/v1/legislations")
 
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+# Client-facing error messages (templates are filled with str.format)
+ERR_PAGE_TOO_LOW = "page must be >= 1"
+ERR_PAGE_TOO_HIGH = "page must be <= {total_pages}"
+ERR_LIMIT_TOO_LOW = "limit must be >= 1"
+ERR_QUERY_REQUIRED = "q parameter is required"
+ERR_QUERY_TOO_SHORT = "Query must be at least 2 characters"
+ERR_ID_REQUIRED = "legislation_id is required"
+ERR_NOT_FOUND = "Legislation '{legislation_id}' not found"
+ERR_LIST_FAILED = "Failed to list legislations"
+ERR_SEARCH_FAILED = "Failed to search legislations"
+ERR_FETCH_FAILED = "Failed to fetch legislation"
+
 # ── In-memory state ───────────────────────────────────────────────────────────
 
 # Cache for legislations data (invalidated after a successful scrape)
@@ -103,17 +120,17 @@ def list_legislations():
 
     Query parameters:
       page  (int, default 1)
-      limit (int, default 10, max 100)
+      limit (int, default DEFAULT_PAGE_SIZE, max MAX_PAGE_SIZE)
     """
     try:
         page = request.args.get("page", 1, type=int)
-        limit = request.args.get("limit", 10, type=int)
+        limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
 
         if page < 1:
-            return _error("page must be >= 1")
+            return _error(ERR_PAGE_TOO_LOW)
         if limit < 1:
-            return _error("limit must be >= 1")
-        limit = min(limit, 100)
+            return _error(ERR_LIMIT_TOO_LOW)
+        limit = min(limit, MAX_PAGE_SIZE)
 
         legislations = _load_legislations()
         total = len(legislations)
@@ -124,7 +141,7 @@ def list_legislations():
 
         total_pages = (total + limit - 1) // limit
         if page > total_pages:
-            return _error(f"page must be <= {total_pages}")
+            return _error(ERR_PAGE_TOO_HIGH.format(total_pages=total_pages))
 
         start = (page - 1) * limit
         data = [_strip_sections(leg) for leg in legislations[start:start + limit]]
@@ -137,7 +154,7 @@ def list_legislations():
 
     except Exception as e:
         logger.error(f"Error listing legislations: {e}")
-        return _error("Failed to list legislations", 500)
+        return _error(ERR_LIST_FAILED, 500)
 
 
 # ── Search ────────────────────────────────────────────────────────────────────
@@ -149,18 +166,18 @@ def search_legislations():
 
     Query parameters:
       q     (str, required, min 2 chars) — searches title, description, shortcode, id
-      limit (int, default 20, max 100)
+      limit (int, default DEFAULT_SEARCH_LIMIT, max MAX_SEARCH_LIMIT)
     """
     try:
         query = request.args.get("q", "").strip()
-        limit = min(request.args.get("limit", 20, type=int), 100)
+        limit = min(request.args.get("limit", DEFAULT_SEARCH_LIMIT, type=int), MAX_SEARCH_LIMIT)
 
         if not query:
-            return _error("q parameter is required")
+            return _error(ERR_QUERY_REQUIRED)
         if len(query) < 2:
-            return _error("Query must be at least 2 characters")
+            return _error(ERR_QUERY_TOO_SHORT)
         if limit < 1:
-            return _error("limit must be >= 1")
+            return _error(ERR_LIMIT_TOO_LOW)
 
         legislations = _load_legislations()
         q = query.lower()
@@ -183,7 +200,7 @@ def search_legislations():
 
     except Exception as e:
         logger.error(f"Error searching legislations: {e}")
-        return _error("Failed to search legislations", 500)
+        return _error(ERR_SEARCH_FAILED, 500)
 
 
 # ── Detail ────────────────────────────────────────────────────────────────────
@@ -195,17 +212,17 @@ def get_legislation(legislation_id: str):
     try:
         legislation_id = legislation_id.strip().lower()
         if not legislation_id:
-            return _error("legislation_id is required")
+            return _error(ERR_ID_REQUIRED)
 
         for leg in _load_legislations():
             if leg.get("id", "").lower() == legislation_id:
                 return jsonify({"success": True, "data": leg})
 
-        return _error(f"Legislation '{legislation_id}' not found", 404)
+        return _error(ERR_NOT_FOUND.format(legislation_id=legislation_id), 404)
 
     except Exception as e:
         logger.error(f"Error fetching legislation {legislation_id}: {e}")
-        return _error("Failed to fetch legislation", 500)
+        return _error(ERR_FETCH_FAILED, 500)
 
 
 # ── Update (background scrape job) ────────────────────────────────────────────
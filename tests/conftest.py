@@ -1,6 +1,8 @@
 """Shared test fixtures for IMMI-Case tests."""
 
+import ast
 import os
+import shutil
 import pytest
 import responses
 
@@ -9,6 +11,7 @@ from immi_case_downloader.storage import save_cases_csv, save_cases_json, ensure
 
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def _load_fixture(name: str) -> str:
@@ -43,6 +46,18 @@ def reset_rate_limiter():
         rate_limiter.reset()
 
 
+@pytest.fixture(autouse=True)
+def reset_job_state():
+    """Start and end every test with the default shared web job status."""
+    from immi_case_downloader.web.jobs import job_manager
+
+    job_manager.reset()
+    try:
+        yield
+    finally:
+        job_manager.reset()
+
+
 def _reset_pipeline_status():
     """Reset the active pipeline reference so no state leaks across tests."""
     from immi_case_downloader import pipeline as pipeline_module
@@ -92,6 +107,34 @@ def reset_analytics_caches():
         _clear()
 
 
+@pytest.fixture(scope="session")
+def empty_case():
+    """A default-constructed ImmigrationCase, shared read-only across the session."""
+    return ImmigrationCase()
+
+
+@pytest.fixture(scope="session")
+def case_field_names():
+    """Names of every ImmigrationCase dataclass field."""
+    return frozenset(ImmigrationCase.__dataclass_fields__)
+
+
+@pytest.fixture(scope="session")
+def web_py_ast():
+    """Parsed AST of the top-level ``web.py`` entry point."""
+    with open(os.path.join(REPO_ROOT, "web.py"), encoding="utf-8") as f:
+        return ast.parse(f.read())
+
+
+@pytest.fixture(scope="session")
+def web_package_source():
+    """Source text of ``immi_case_downloader/web/__init__.py``."""
+    import immi_case_downloader.web as web_mod
+
+    with open(web_mod.__file__, encoding="utf-8") as f:
+        return f.read()
+
+
 @pytest.fixture
 def sample_case():
     """A fully populated ImmigrationCase."""
@@ -121,9 +164,8 @@ def sample_case():
     return case
 
 
-@pytest.fixture
-def sample_cases():
-    """Multiple ImmigrationCase objects with unique URLs."""
+def _build_sample_cases():
+    """Five ImmigrationCase objects, one per court, with unique URLs."""
     cases = []
     courts = [
         ("AATA", "Administrative Appeals Tribunal"),
@@ -150,32 +192,113 @@ def sample_cases():
     return cases
 
 
+def _populate_dir(path, cases):
+    """Write *cases* as CSV and JSON into the output layout under *path*."""
+    ensure_output_dirs(str(path))
+    save_cases_csv(cases, str(path))
+    save_cases_json(cases, str(path))
+    return path
+
+
 @pytest.fixture
-def populated_dir(tmp_path, sample_cases):
-    """A tmp directory pre-populated with CSV and JSON data."""
-    ensure_output_dirs(str(tmp_path))
-    save_cases_csv(sample_cases, str(tmp_path))
-    save_cases_json(sample_cases, str(tmp_path))
-    return tmp_path
+def sample_cases():
+    """Multiple ImmigrationCase objects with unique URLs."""
+    return _build_sample_cases()
+
+
+@pytest.fixture(scope="session")
+def _base_populated_dir(tmp_path_factory):
+    """The sample-case CSV/JSON layout, written once for ``populated_dir`` to copy."""
+    return _populate_dir(tmp_path_factory.mktemp("populated_base"), _build_sample_cases())
 
 
 @pytest.fixture
-def app(populated_dir):
-    """Flask test app backed by populated_dir data (CSRF disabled for general tests)."""
+def populated_dir(tmp_path, sample_cases, _base_populated_dir):
+    """A tmp directory pre-populated with CSV and JSON data for ``sample_cases``.
+
+    Copied from the session baseline (fresh mtimes, no metadata), so each
+    test can still write to its own directory.
+    """
+    shutil.copytree(_base_populated_dir, tmp_path, dirs_exist_ok=True, copy_function=shutil.copy)
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def populated_dir_module(tmp_path_factory):
+    """Like ``populated_dir`` but created once per module, for module-scoped apps.
+
+    Tests sharing it must treat the data as read-only.
+    """
+    return _populate_dir(tmp_path_factory.mktemp("populated"), _build_sample_cases())
+
+
+@pytest.fixture(scope="session")
+def _session_app(tmp_path_factory):
+    """One CSV-backed Flask app for the session; ``app`` re-points it per test."""
     from immi_case_downloader.webapp import create_app
 
-    application = create_app(str(populated_dir))
+    application = create_app(str(tmp_path_factory.mktemp("app_data")))
     application.config["TESTING"] = True
     application.config["WTF_CSRF_ENABLED"] = False
     return application
 
 
+@pytest.fixture
+def app(_session_app, populated_dir):
+    """Flask test app backed by populated_dir data (CSRF disabled for general tests).
+
+    The session app is pointed at this test's directory, and its config is
+    restored afterwards so per-test config changes cannot leak.
+    """
+    from immi_case_downloader.csv_repository import CsvRepository
+
+    saved_config = dict(_session_app.config)
+    _session_app.config.update(
+        OUTPUT_DIR=str(populated_dir),
+        REPO=CsvRepository(str(populated_dir)),
+        BACKEND="csv",
+    )
+    yield _session_app
+    _session_app.config.clear()
+    _session_app.config.update(saved_config)
+
+
 @pytest.fixture
 def client(app):
     """Flask test client."""
     return app.test_client()
 
 
+@pytest.fixture(scope="session")
+def flask_app():
+    """Default-config Flask app (``create_app()`` with no args), built once per session.
+
+    Shared across modules, so tests must not mutate ``app.config``; build a
+    dedicated app instead when a test needs different configuration.
+    """
+    from immi_case_downloader.web import create_app
+
+    application = create_app()
+    application.config["TESTING"] = True
+    # Warm Werkzeug's lazily compiled URL matcher once, up front. Matching
+    # (rather than issuing requests) avoids running views, which could fill
+    # module-level caches such as the legislations cache from disk.
+    adapter = application.url_map.bind("localhost")
+    for path in ("/api/v1/legislations", "/api/v1/legislations/search", "/api/v1/legislations/x"):
+        adapter.match(path)
+    return application
+
+
+@pytest.fixture(scope="class")
+def api_client(flask_app):
+    """Test client on the shared ``flask_app``, reused across a test class.
+
+    Suits read-only API tests that stub their data source per test; modules
+    needing a differently configured app define their own ``api_client``.
+    """
+    return flask_app.test_client()
+
+
 # ── Phase 2: HTML fixture loaders ─────────────────────────────────────────
 
 
@@ -72,6 +72,20 @@ class TestCasesCacheTTL:
         result = load_all_cases(str(tmp_path))
         assert len(result) == 2
 
+    def test_external_write_invalidates_cache(self, tmp_path):
+        """A CSV rewritten behind the cache's back (e.g. by another process) is re-read."""
+        ensure_output_dirs(str(tmp_path))
+        case = ImmigrationCase(citation="[2024] TEST 6", url="https://example.com/6", court_code="AATA")
+        case.ensure_id()
+        save_cases_csv([case], str(tmp_path))
+        csv_path = tmp_path / "immigration_cases.csv"
+        original = csv_path.read_bytes()
+
+        load_all_cases(str(tmp_path))  # populate cache
+        csv_path.write_bytes(original.replace(b"AATA", b"FCCA"))
+
+        assert load_all_cases(str(tmp_path))[0].court_code == "FCCA"
+
     def test_different_base_dir_not_cached(self, tmp_path):
         """Different base_dir triggers fresh load."""
         dir1 = tmp_path / "dir1"
@@ -5,10 +5,9 @@ Tests cover TOC parsing, section text extraction, last_amended detection,
 and the full scrape_one() pipeline.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-import requests
 
 from immi_case_downloader.sources.legislation_scraper import (
     KNOWN_LAWS,
@@ -41,6 +40,9 @@ TOC_HTML = """
 </body></html>
 """
 
+# TOC that links s1 a second time, to exercise section-ID dedup
+DUPLICATE_TOC_HTML = TOC_HTML + '<a href="s1.html">1  Short title</a>'
+
 SECTION_HTML = """
 <html><body>
 <nav>Navigation</nav>
@@ -66,140 +68,184 @@ SECTION_HTML_NO_BODY = """
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scraper():
+    # Stateless between tests: every fetch/scrape_one stub is applied via a
+    # context-managed patch.object, so one instance serves the whole module.
     return LegislationScraper(delay=0)  # No delay in tests
 
 
-def make_response(text: str, status: int = 200) -> MagicMock:
-    """Create a mock requests.Response."""
-    resp = MagicMock(spec=requests.Response)
-    resp.text = text
-    resp.status_code = status
-    resp.raise_for_status = MagicMock()
-    return resp
+class FakeResponse:
+    """Minimal stand-in for requests.Response.
+
+    scrape_one only reads ``.text``/``.status_code``, so a plain object avoids
+    MagicMock's spec introspection of requests.Response.
+    """
+
+    __slots__ = ("text", "status_code")
+
+    def __init__(self, text: str, status_code: int = 200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def make_response(text: str, status: int = 200) -> FakeResponse:
+    """Create a stub requests.Response."""
+    return FakeResponse(text, status)
+
+
+# Built once and shared: scrape_one only reads .text from these responses.
+TOC_RESP = make_response(TOC_HTML)
+SECTION_RESP = make_response(SECTION_HTML)
+# TOC page followed by one page per TOC_HTML section (s1, s2, s501, s501a)
+STANDARD_RESPONSES = (TOC_RESP,) + (SECTION_RESP,) * 4
+
+
+def scraper_with(responses) -> LegislationScraper:
+    """Build a scraper whose fetches are served, in order, from ``responses``."""
+    queue = iter(responses)
+    return LegislationScraper(delay=0, fetcher=lambda url: next(queue))
 
 
 # ── TOC parsing ───────────────────────────────────────────────────────────────
 
-class TestParseToc:
-    def test_finds_section_links(self, scraper):
-        links = scraper._parse_toc(TOC_HTML, "https://www.austlii.edu.au/au/legis/cth/consol_act/ma1958116/")
-        assert len(links) == 4  # s1, s2, s501, s501a (sch1 excluded — not s*.html)
+TOC_URL = "https://www.austlii.edu.au/au/legis/cth/consol_act/ma1958116/"
 
-    def test_section_id_stripped(self, scraper):
-        links = scraper._parse_toc(TOC_HTML, "https://example.com/")
-        ids = [lk.section_id for lk in links]
-        assert "s1" in ids
-        assert "s501" in ids
-        assert "s501a" in ids
 
-    def test_part_context_tracked(self, scraper):
-        links = scraper._parse_toc(TOC_HTML, "https://example.com/")
-        by_id = {lk.section_id: lk for lk in links}
+@pytest.fixture(scope="class")
+def bind_scraper(request, scraper):
+    # Expose the shared scraper as ``self.scraper`` on the requesting class.
+    request.cls.scraper = scraper
 
-        assert by_id["s1"].part == "Part 1—Preliminary"
-        assert by_id["s501"].part == "Part 9—Deportation"
 
-    def test_division_context_tracked(self, scraper):
-        links = scraper._parse_toc(TOC_HTML, "https://example.com/")
-        by_id = {lk.section_id: lk for lk in links}
+@pytest.fixture(scope="class")
+def toc_links(scraper):
+    # Parsed once per class; tests only read the resulting links.
+    return scraper._parse_toc(TOC_HTML, TOC_URL)
 
-        assert by_id["s501"].division == "Division 2—Cancellation of visas"
-        assert by_id["s1"].division == ""  # Part 1 has no division
 
-    def test_number_and_title_parsed(self, scraper):
-        links = scraper._parse_toc(TOC_HTML, "https://example.com/")
-        by_id = {lk.section_id: lk for lk in links}
+@pytest.fixture(scope="class")
+def toc_by_id(toc_links):
+    return {lk.section_id: lk for lk in toc_links}
 
-        assert by_id["s501"].number == "501"
-        assert by_id["s501"].title == "Character test"
-        assert by_id["s1"].number == "1"
-        assert by_id["s1"].title == "Short title"
 
-    def test_absolute_url_built(self, scraper):
-        links = scraper._parse_toc(TOC_HTML, "https://www.austlii.edu.au/au/legis/cth/consol_act/ma1958116/")
-        assert links[0].url.startswith("https://")
-        assert "ma1958116" in links[0].url
+@pytest.mark.usefixtures("bind_scraper")
+class TestParseToc:
+    def test_finds_section_links(self, toc_links):
+        assert len(toc_links) == 4  # s1, s2, s501, s501a (sch1 excluded — not s*.html)
+
+    def test_section_id_stripped(self, toc_links):
+        ids = [lk.section_id for lk in toc_links]
+        assert "s1" in ids
+        assert "s501" in ids
+        assert "s501a" in ids
 
-    def test_no_duplicate_section_ids(self, scraper):
+    @pytest.mark.parametrize("section_id, attr, expected", [
+        ("s1", "part", "Part 1—Preliminary"),
+        ("s501", "part", "Part 9—Deportation"),
+        ("s501", "division", "Division 2—Cancellation of visas"),
+        ("s1", "division", ""),  # Part 1 has no division
+        ("s501", "number", "501"),
+        ("s501", "title", "Character test"),
+        ("s1", "number", "1"),
+        ("s1", "title", "Short title"),
+    ])
+    def test_link_attribute(self, toc_by_id, section_id, attr, expected):
+        assert getattr(toc_by_id[section_id], attr) == expected
+
+    def test_absolute_url_built(self, toc_links):
+        assert toc_links[0].url.startswith("https://")
+        assert "ma1958116" in toc_links[0].url
+
+    def test_no_duplicate_section_ids(self):
         # If TOC links same section twice, dedup should apply
-        duplicate_toc = TOC_HTML + '<a href="s1.html">1  Short title</a>'
-        links = scraper._parse_toc(duplicate_toc, "https://example.com/")
+        links = self.scraper._parse_toc(DUPLICATE_TOC_HTML, "https://example.com/")
         ids = [lk.section_id for lk in links]
         assert ids.count("s1") == 1
 
-    def test_empty_body_returns_empty_list(self, scraper):
-        links = scraper._parse_toc("<html><body></body></html>", "https://example.com/")
+    def test_empty_body_returns_empty_list(self):
+        links = self.scraper._parse_toc("<html><body></body></html>", "https://example.com/")
         assert links == []
 
 
 # ── Text extraction ───────────────────────────────────────────────────────────
 
+@pytest.fixture(scope="class")
+def section_text(scraper):
+    # SECTION_HTML is extracted once per class; tests only inspect the result.
+    return scraper._extract_section_text(SECTION_HTML)
+
+
+@pytest.mark.usefixtures("bind_scraper")
 class TestExtractSectionText:
-    def test_removes_nav_and_footer(self, scraper):
-        text = scraper._extract_section_text(SECTION_HTML)
-        assert "Navigation" not in text
-        assert "Footer" not in text
-
-    def test_includes_section_content(self, scraper):
-        text = scraper._extract_section_text(SECTION_HTML)
-        assert "Character test" in text
-        assert "criminal history" in text
-
-    def test_fallback_to_body_when_no_body_div(self, scraper):
-        text = scraper._extract_section_text(SECTION_HTML_NO_BODY)
+    def test_removes_nav_and_footer(self, section_text):
+        assert "Navigation" not in section_text
+        assert "Footer" not in section_text
+
+    def test_includes_section_content(self, section_text):
+        assert "Character test" in section_text
+        assert "criminal history" in section_text
+
+    def test_fallback_to_body_when_no_body_div(self):
+        text = self.scraper._extract_section_text(SECTION_HTML_NO_BODY)
         assert "Short title" in text
         assert "Migration Act 1958" in text
 
-    def test_collapses_excess_blank_lines(self, scraper):
+    def test_collapses_excess_blank_lines(self):
         html = "<html><body><div class='body'>Line 1\n\n\n\n\nLine 2</div></body></html>"
-        text = scraper._extract_section_text(html)
+        text = self.scraper._extract_section_text(html)
         assert "\n\n\n" not in text
 
-    def test_returns_stripped_string(self, scraper):
-        text = scraper._extract_section_text(SECTION_HTML)
-        assert text == text.strip()
+    def test_returns_stripped_string(self, section_text):
+        assert section_text == section_text.strip()
 
 
 # ── Last amended parsing ──────────────────────────────────────────────────────
 
+@pytest.mark.usefixtures("bind_scraper")
 class TestParseLastAmended:
-    def test_extracts_amended_to_date(self, scraper):
+    def test_extracts_amended_to_date(self):
         html = "<p>Series as amended to 1 December 2025</p>"
-        assert scraper._parse_last_amended(html) == "1 December 2025"
+        assert self.scraper._parse_last_amended(html) == "1 December 2025"
 
-    def test_extracts_as_at_date(self, scraper):
+    def test_extracts_as_at_date(self):
         html = "<p>Authoritative version as at 15 November 2025</p>"
-        assert scraper._parse_last_amended(html) == "15 November 2025"
+        assert self.scraper._parse_last_amended(html) == "15 November 2025"
 
-    def test_returns_empty_string_when_not_found(self, scraper):
-        assert scraper._parse_last_amended("<p>No date here</p>") == ""
+    def test_returns_empty_string_when_not_found(self):
+        assert self.scraper._parse_last_amended("<p>No date here</p>") == ""
 
-    def test_case_insensitive(self, scraper):
+    def test_case_insensitive(self):
         html = "<p>AMENDED TO 5 January 2026</p>"
-        assert scraper._parse_last_amended(html) == "5 January 2026"
+        assert self.scraper._parse_last_amended(html) == "5 January 2026"
 
 
 # ── scrape_one() integration ──────────────────────────────────────────────────
 
+@pytest.mark.usefixtures("bind_scraper")
 class TestScrapeOne:
-    def test_returns_none_for_unknown_law(self, scraper):
-        result = scraper.scrape_one("nonexistent-law-id")
-        assert result is None
+    def test_returns_none_for_unknown_law(self):
+        def fail_fetch(url):
+            pytest.fail(f"unknown law_id must not fetch {url}")
 
-    def test_returns_none_when_toc_fetch_fails(self, scraper):
-        with patch.object(scraper, "fetch", return_value=None):
-            result = scraper.scrape_one("migration-act-1958")
+        scraper = LegislationScraper(delay=0, fetcher=fail_fetch)
+        assert scraper.scrape_one("nonexistent-law-id") is None
+
+    def test_returns_none_when_toc_fetch_fails(self):
+        result = scraper_with([None]).scrape_one("migration-act-1958")
         assert result is None
 
-    def test_returns_dict_with_required_keys(self, scraper):
-        toc_resp = make_response(TOC_HTML)
-        sec_resp = make_response(SECTION_HTML)
+    def test_uses_base_fetch_without_injected_fetcher(self):
+        with patch.object(self.scraper, "fetch", return_value=None) as fetch:
+            assert self.scraper.scrape_one("migration-act-1958") is None
+        fetch.assert_called_once()
 
-        responses = [toc_resp, sec_resp, sec_resp, sec_resp, sec_resp]
-        with patch.object(scraper, "fetch", side_effect=responses):
-            result = scraper.scrape_one("migration-act-1958")
+    def test_returns_dict_with_required_keys(self):
+        scraper = scraper_with(STANDARD_RESPONSES)
+        result = scraper.scrape_one("migration-act-1958")
 
         assert result is not None
         required = {"id", "title", "austlii_id", "shortcode", "type",
@@ -207,35 +253,24 @@ class TestScrapeOne:
                     "last_amended", "last_scraped", "sections"}
         assert required.issubset(result.keys())
 
-    def test_sections_count_matches_sections_list(self, scraper):
-        toc_resp = make_response(TOC_HTML)
-        sec_resp = make_response(SECTION_HTML)
-        responses = [toc_resp] + [sec_resp] * 4
-
-        with patch.object(scraper, "fetch", side_effect=responses):
-            result = scraper.scrape_one("migration-act-1958")
+    def test_sections_count_matches_sections_list(self):
+        scraper = scraper_with(STANDARD_RESPONSES)
+        result = scraper.scrape_one("migration-act-1958")
 
         assert result is not None
         assert result["sections_count"] == len(result["sections"])
 
-    def test_law_id_preserved(self, scraper):
-        toc_resp = make_response(TOC_HTML)
-        sec_resp = make_response(SECTION_HTML)
-        responses = [toc_resp] + [sec_resp] * 4
-
-        with patch.object(scraper, "fetch", side_effect=responses):
-            result = scraper.scrape_one("migration-act-1958")
+    def test_law_id_preserved(self):
+        scraper = scraper_with(STANDARD_RESPONSES)
+        result = scraper.scrape_one("migration-act-1958")
 
         assert result is not None
         assert result["id"] == "migration-act-1958"
 
-    def test_section_fetch_failure_uses_placeholder(self, scraper):
+    def test_section_fetch_failure_uses_placeholder(self):
         """If a section page 404s, placeholder text is used instead of crashing."""
-        toc_resp = make_response(TOC_HTML)
-        responses = [toc_resp, None, make_response(SECTION_HTML), None, make_response(SECTION_HTML)]
-
-        with patch.object(scraper, "fetch", side_effect=responses):
-            result = scraper.scrape_one("migration-act-1958")
+        scraper = scraper_with([TOC_RESP, None, SECTION_RESP, None, SECTION_RESP])
+        result = scraper.scrape_one("migration-act-1958")
 
         assert result is not None
         placeholder_sections = [
@@ -244,31 +279,28 @@ class TestScrapeOne:
         ]
         assert len(placeholder_sections) == 2
 
-    def test_progress_callback_called(self, scraper):
-        toc_resp = make_response(TOC_HTML)
-        sec_resp = make_response(SECTION_HTML)
-        responses = [toc_resp] + [sec_resp] * 4
+    def test_progress_callback_called(self):
+        scraper = scraper_with(STANDARD_RESPONSES)
 
-        calls = []
+        # Only the call count and the final call are asserted on.
+        call_count = 0
+        last = None
         def callback(law_id, current, total, section_id):
-            calls.append((law_id, current, total, section_id))
+            nonlocal call_count, last
+            call_count += 1
+            last = (law_id, current, total, section_id)
 
-        with patch.object(scraper, "fetch", side_effect=responses):
-            scraper.scrape_one("migration-act-1958", progress_callback=callback)
+        scraper.scrape_one("migration-act-1958", progress_callback=callback)
 
         # Should have calls for each section + final "done"
-        assert len(calls) > 0
-        last = calls[-1]
+        assert call_count > 0
         assert last[3] == "done"
         assert last[1] == last[2]  # current == total on "done"
 
-    def test_last_amended_extracted(self, scraper):
-        toc_resp = make_response(TOC_HTML)  # Contains "amended to 1 December 2025"
-        sec_resp = make_response(SECTION_HTML)
-        responses = [toc_resp] + [sec_resp] * 4
-
-        with patch.object(scraper, "fetch", side_effect=responses):
-            result = scraper.scrape_one("migration-act-1958")
+    def test_last_amended_extracted(self):
+        # TOC_HTML contains "amended to 1 December 2025"
+        scraper = scraper_with(STANDARD_RESPONSES)
+        result = scraper.scrape_one("migration-act-1958")
 
         assert result is not None
         assert "2025" in result["last_amended"]
@@ -276,58 +308,67 @@ class TestScrapeOne:
 
 # ── scrape_all() ──────────────────────────────────────────────────────────────
 
+KNOWN_LAW_IDS = frozenset(KNOWN_LAWS)
+
+
+def scraper_stubbing_scrape_one(scrape_one) -> LegislationScraper:
+    """Build a scraper whose scrape_one is replaced by ``scrape_one``.
+
+    The instance attribute shadows the method, so no patch/restore is needed.
+    """
+    scraper = LegislationScraper(delay=0)
+    scraper.scrape_one = scrape_one
+    return scraper
+
+
 class TestScrapeAll:
-    def test_returns_list(self, scraper):
-        with patch.object(scraper, "scrape_one", return_value=None):
-            result = scraper.scrape_all()
+    def test_returns_list(self):
+        scraper = scraper_stubbing_scrape_one(lambda law_id, **kwargs: None)
+        result = scraper.scrape_all()
         assert isinstance(result, list)
 
-    def test_skips_failed_laws(self, scraper):
-        results = [{"id": "migration-act-1958"}, None, {"id": "australian-citizenship-act-2007"}]
-        with patch.object(scraper, "scrape_one", side_effect=results):
-            output = scraper.scrape_all(["migration-act-1958", "migration-regulations-1994", "australian-citizenship-act-2007"])
+    def test_skips_failed_laws(self):
+        results = iter([{"id": "migration-act-1958"}, None, {"id": "australian-citizenship-act-2007"}])
+        scraper = scraper_stubbing_scrape_one(lambda law_id, **kwargs: next(results))
+        output = scraper.scrape_all(["migration-act-1958", "migration-regulations-1994", "australian-citizenship-act-2007"])
         assert len(output) == 2
 
-    def test_only_scrapes_requested_ids(self, scraper):
+    def test_only_scrapes_requested_ids(self):
         scraped_ids = []
         def mock_scrape(law_id, **kwargs):
             scraped_ids.append(law_id)
             return {"id": law_id}
 
-        with patch.object(scraper, "scrape_one", side_effect=mock_scrape):
-            scraper.scrape_all(["migration-act-1958"])
+        scraper_stubbing_scrape_one(mock_scrape).scrape_all(["migration-act-1958"])
 
         assert scraped_ids == ["migration-act-1958"]
 
-    def test_default_scrapes_all_known_laws(self, scraper):
+    def test_default_scrapes_all_known_laws(self):
         scraped_ids = []
         def mock_scrape(law_id, **kwargs):
             scraped_ids.append(law_id)
             return {"id": law_id}
 
-        with patch.object(scraper, "scrape_one", side_effect=mock_scrape):
-            scraper.scrape_all()
+        scraper_stubbing_scrape_one(mock_scrape).scrape_all()
 
-        assert set(scraped_ids) == set(KNOWN_LAWS.keys())
+        assert frozenset(scraped_ids) == KNOWN_LAW_IDS
 
 
 # ── KNOWN_LAWS sanity check ───────────────────────────────────────────────────
 
-class TestKnownLaws:
-    def test_all_required_keys_present(self):
-        required = {"austlii_id", "title", "shortcode", "type", "jurisdiction", "description"}
-        for law_id, meta in KNOWN_LAWS.items():
-            missing = required - set(meta.keys())
-            assert not missing, f"{law_id} is missing keys: {missing}"
+REQUIRED_LAW_KEYS = frozenset({"austlii_id", "title", "shortcode", "type", "jurisdiction", "description"})
 
-    def test_austlii_id_format(self):
-        for law_id, meta in KNOWN_LAWS.items():
-            assert "/" in meta["austlii_id"], f"{law_id} austlii_id has no '/'"
-            assert meta["austlii_id"].startswith("consol_"), f"{law_id} austlii_id should start with consol_"
 
-    def test_five_laws_defined(self):
+class TestKnownLaws:
+    def test_known_laws_schema(self):
         # AATA 1975 was repealed Oct 2024 (replaced by ARTA 2024) and removed from AustLII.
         assert len(KNOWN_LAWS) == 5
+        for law_id, meta in KNOWN_LAWS.items():
+            keys = meta.keys()
+            assert REQUIRED_LAW_KEYS <= keys, f"{law_id} is missing keys: {REQUIRED_LAW_KEYS - keys}"
+            austlii_id = meta["austlii_id"]
+            assert "/" in austlii_id, f"{law_id} austlii_id has no '/'"
+            assert austlii_id.startswith("consol_"), f"{law_id} austlii_id should start with consol_"
 
     def test_austlii_ids_are_current(self):
         """Verify the AustLII IDs match confirmed live URLs (updated 2026-02-21)."""
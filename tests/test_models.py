@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from immi_case_downloader.models import ImmigrationCase
@@ -14,12 +15,9 @@ class TestToDict:
         restored = ImmigrationCase.from_dict(d)
         assert restored.to_dict() == d
 
-    def test_contains_all_fields(self):
+    def test_contains_all_fields(self, empty_case, case_field_names):
         """to_dict() includes every dataclass field."""
-        case = ImmigrationCase()
-        d = case.to_dict()
-        expected_keys = {f.name for f in ImmigrationCase.__dataclass_fields__.values()}
-        assert set(d.keys()) == expected_keys
+        assert empty_case.to_dict().keys() == case_field_names
 
 
 class TestEnsureId:
@@ -73,50 +71,33 @@ class TestFromDict:
         assert case.year == 2024
         assert case.court == "Federal Court"
 
-    def test_nan_float(self):
-        """pandas NaN (float) is converted to empty string / 0."""
-        data = {
-            "citation": float("nan"),
-            "year": float("nan"),
-            "court": float("nan"),
-        }
+    @pytest.mark.parametrize("data, expected", [
+        # pandas NaN (float) is converted to empty string / 0
+        ({"citation": float("nan"), "year": float("nan"), "court": float("nan")},
+         {"citation": "", "year": 0, "court": ""}),
+        # String 'nan' is treated as missing
+        ({"citation": "nan", "year": "nan"}, {"citation": "", "year": 0}),
+        # NaN float subclasses (numpy scalars from pandas columns) take the same path
+        ({"citation": np.float64("nan"), "year": np.float64(math.nan)}, {"citation": "", "year": 0}),
+        # None values become empty string / 0
+        ({"citation": None, "year": None}, {"citation": "", "year": 0}),
+        # Empty strings stay empty, year becomes 0
+        ({"citation": "", "year": ""}, {"citation": "", "year": 0}),
+        ({"year": 2024}, {"year": 2024}),
+        ({"year": "2024"}, {"year": 2024}),
+        ({"year": "not-a-year"}, {"year": 0}),
+        ({"year": 0}, {"year": 0}),
+        # pandas writes a gappy year column as floats
+        ({"year": "2024.0"}, {"year": 2024}),
+    ], ids=[
+        "nan_float", "nan_string", "numpy_nan", "none_values", "empty_strings",
+        "year_valid_int", "year_valid_string", "year_invalid_string", "year_zero",
+        "year_float_string",
+    ])
+    def test_normalises_values(self, data, expected):
         case = ImmigrationCase.from_dict(data)
-        assert case.citation == ""
-        assert case.year == 0
-        assert case.court == ""
-
-    def test_nan_string(self):
-        """String 'nan' is treated as missing."""
-        data = {"citation": "nan", "year": "nan"}
-        case = ImmigrationCase.from_dict(data)
-        assert case.citation == ""
-        assert case.year == 0
-
-    def test_none_values(self):
-        """None values become empty string / 0."""
-        data = {"citation": None, "year": None}
-        case = ImmigrationCase.from_dict(data)
-        assert case.citation == ""
-        assert case.year == 0
-
-    def test_empty_strings(self):
-        """Empty strings stay empty, year becomes 0."""
-        data = {"citation": "", "year": ""}
-        case = ImmigrationCase.from_dict(data)
-        assert case.citation == ""
-        assert case.year == 0
-
-    def test_year_valid_int(self):
-        assert ImmigrationCase.from_dict({"year": 2024}).year == 2024
-
-    def test_year_valid_string(self):
-        assert ImmigrationCase.from_dict({"year": "2024"}).year == 2024
-
-    def test_year_invalid_string(self):
-        assert ImmigrationCase.from_dict({"year": "not-a-year"}).year == 0
-
-    def test_year_zero(self):
-        assert ImmigrationCase.from_dict({"year": 0}).year == 0
+        for name, value in expected.items():
+            assert getattr(case, name) == value, f"{name}: {getattr(case, name)!r}"
 
     def test_ignores_unknown_keys(self):
         """Unknown keys are silently dropped."""
@@ -134,13 +115,10 @@ class TestFromDict:
 
 
 class TestDefaults:
-    def test_all_string_fields_empty(self):
+    def test_all_string_fields_empty(self, empty_case, case_field_names):
         """All string fields default to empty string."""
-        case = ImmigrationCase()
-        for f in ImmigrationCase.__dataclass_fields__.values():
-            if f.name == "year":
-                continue
-            assert getattr(case, f.name) == "", f"Field {f.name} not empty"
+        for name in case_field_names - {"year"}:
+            assert getattr(empty_case, name) == "", f"Field {name} not empty"
 
-    def test_year_default_zero(self):
-        assert ImmigrationCase().year == 0
+    def test_year_default_zero(self, empty_case):
+        assert empty_case.year == 0
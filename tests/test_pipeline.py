@@ -1,9 +1,10 @@
 """Tests for immi_case_downloader.pipeline — Phase 6."""
 
 import threading
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
+from werkzeug.datastructures import MultiDict
 
 from immi_case_downloader.pipeline import (
     PipelineConfig,
@@ -69,20 +70,20 @@ class TestPipelineConfig:
         assert isinstance(config.delay, float)
 
     def test_from_form_custom_config(self):
-        form = MagicMock()
-        form.get.side_effect = lambda key, default="": {
-            "preset": "",
-            "start_year": "2023",
-            "end_year": "2024",
-            "delay": "1.5",
-            "auto_rotate": "on",
-            "fix_year_zero": "on",
-            "deduplicate": "on",
-            "download_enabled": "",
-            "download_batch_size": "100",
-            "download_court_filter": "FCA",
-        }.get(key, default)
-        form.getlist.return_value = ["AATA", "FCA"]
+        form = MultiDict([
+            ("preset", ""),
+            ("start_year", "2023"),
+            ("end_year", "2024"),
+            ("delay", "1.5"),
+            ("auto_rotate", "on"),
+            ("fix_year_zero", "on"),
+            ("deduplicate", "on"),
+            ("download_enabled", ""),
+            ("download_batch_size", "100"),
+            ("download_court_filter", "FCA"),
+            ("databases", "AATA"),
+            ("databases", "FCA"),
+        ])
 
         config = PipelineConfig.from_form(form)
         assert config.databases == ["AATA", "FCA"]
@@ -94,6 +95,22 @@ class TestPipelineConfig:
 # ── PipelineLog ──────────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="class")
+def populated_log():
+    """A PipelineLog holding a mix of phases, levels and error categories.
+
+    Shared across a test class, so tests must only query it.
+    """
+    log = PipelineLog()
+    log.add("crawl", "info", "a", "m1")
+    log.add("clean", "info", "b", "m2")
+    log.add("crawl", "warn", "c", "m3")
+    log.add("crawl", "error", "http_500", "e1")
+    log.add("crawl", "error", "http_500", "e2")
+    log.add("crawl", "error", "dns_error", "e3")
+    return log
+
+
 class TestPipelineLog:
     def test_add_and_retrieve(self):
         log = PipelineLog()
@@ -103,56 +120,42 @@ class TestPipelineLog:
         assert events[0]["phase"] == "crawl"
         assert events[0]["message"] == "Test message"
 
-    def test_filter_by_phase(self):
-        log = PipelineLog()
-        log.add("crawl", "info", "a", "msg1")
-        log.add("clean", "info", "b", "msg2")
-        log.add("crawl", "warn", "c", "msg3")
-
-        crawl_events = log.get_events(phase="crawl")
-        assert len(crawl_events) == 2
-
-    def test_filter_by_level(self):
-        log = PipelineLog()
-        log.add("crawl", "info", "a", "msg1")
-        log.add("crawl", "error", "b", "msg2")
-
-        errors = log.get_events(level="error")
-        assert len(errors) == 1
-
-    def test_limit(self):
-        log = PipelineLog()
-        for i in range(10):
-            log.add("crawl", "info", "x", f"msg{i}")
+    def test_filter_by_phase(self, populated_log):
+        assert [e["message"] for e in populated_log.get_events(phase="crawl")] == [
+            "m1", "m3", "e1", "e2", "e3",
+        ]
+        assert [e["message"] for e in populated_log.get_events(phase="clean")] == ["m2"]
 
-        events = log.get_events(limit=3)
-        assert len(events) == 3
+    def test_filter_by_level(self, populated_log):
+        errors = populated_log.get_events(level="error")
+        assert len(errors) == 3
 
-    def test_error_summary(self):
-        log = PipelineLog()
-        log.add("crawl", "error", "http_500", "Server error 1")
-        log.add("crawl", "error", "http_500", "Server error 2")
-        log.add("crawl", "error", "dns_error", "DNS fail")
+    def test_limit(self, populated_log):
+        events = populated_log.get_events(limit=3)
+        assert [e["message"] for e in events] == ["e1", "e2", "e3"]
 
-        summary = log.get_error_summary()
-        assert summary["http_500"]["count"] == 2
+    def test_error_summary(self, populated_log):
+        summary = populated_log.get_error_summary()
+        assert summary["http_500"] == {"count": 2, "recent": "e2"}
         assert summary["dns_error"]["count"] == 1
 
-    def test_to_json(self):
-        log = PipelineLog()
-        log.add("crawl", "info", "test", "msg")
-        result = log.to_json()
+    def test_to_json(self, populated_log):
+        result = populated_log.to_json()
         assert isinstance(result, list)
-        assert result[0]["category"] == "test"
+        assert len(result) == 6
+        assert result[0]["category"] == "a"
 
     def test_thread_safety(self):
         """Multiple threads adding events concurrently."""
         log = PipelineLog()
         errors = []
+        # Release all threads together so their adds contend in one burst.
+        barrier = threading.Barrier(4)
 
         def add_events(start):
             try:
-                for i in range(50):
+                barrier.wait()
+                for i in range(20):
                     log.add("crawl", "info", "test", f"thread-{start}-{i}")
             except Exception as e:
                 errors.append(e)
@@ -165,12 +168,38 @@ class TestPipelineLog:
 
         assert len(errors) == 0
         events = log.get_events(limit=500)
-        assert len(events) == 200  # 4 threads x 50 events
+        assert len(events) == 80  # 4 threads x 20 events
 
 
 # ── SmartPipeline ────────────────────────────────────────────────────────
 
 
+@pytest.fixture
+def saved_cases():
+    """Capture each list of cases the pipeline saves, instead of reading it back from disk."""
+    saved = []
+    with patch(
+        "immi_case_downloader.pipeline.save_cases_csv",
+        side_effect=lambda cases, *_: saved.append(list(cases)),
+    ), patch("immi_case_downloader.pipeline.save_cases_json"):
+        yield saved
+
+
+@pytest.fixture(scope="module")
+def shared_output_dir(tmp_path_factory):
+    """Output directory tree created once for all SmartPipeline tests."""
+    path = tmp_path_factory.mktemp("pipeline")
+    ensure_output_dirs(str(path))
+    return path
+
+
+@pytest.fixture
+def output_dir(shared_output_dir):
+    """The shared output directory, reset to an empty cases CSV for each test."""
+    save_cases_csv([], str(shared_output_dir))
+    return str(shared_output_dir)
+
+
 class TestSmartPipeline:
     def _make_config(self, **overrides):
         defaults = {
@@ -184,11 +213,8 @@ class TestSmartPipeline:
         return PipelineConfig(**defaults)
 
     @patch("immi_case_downloader.sources.austlii.AustLIIScraper")
-    def test_crawl_phase_basic(self, mock_scraper_cls, tmp_path):
+    def test_crawl_phase_basic(self, mock_scraper_cls, output_dir, saved_cases):
         """Crawl phase finds and saves cases."""
-        ensure_output_dirs(str(tmp_path))
-        save_cases_csv([], str(tmp_path))
-
         mock_scraper = mock_scraper_cls.return_value
         case = ImmigrationCase(
             citation="[2024] AATA 1",
@@ -200,17 +226,14 @@ class TestSmartPipeline:
         mock_scraper._browse_year.return_value = [case]
 
         config = self._make_config()
-        pipeline = SmartPipeline(config, str(tmp_path))
+        pipeline = SmartPipeline(config, output_dir)
         pipeline._run_crawl_phase()
 
-        from immi_case_downloader.storage import load_all_cases
-        cases = load_all_cases(str(tmp_path))
-        assert len(cases) >= 1
+        assert [c.url for c in saved_cases[-1]] == [case.url]
 
     @patch("immi_case_downloader.sources.austlii.AustLIIScraper")
-    def test_clean_phase_fix_year(self, mock_cls, tmp_path):
+    def test_clean_phase_fix_year(self, mock_cls, output_dir, saved_cases):
         """Clean phase fixes year=0 from citation."""
-        ensure_output_dirs(str(tmp_path))
         case = ImmigrationCase(
             citation="[2023] FCA 100",
             url="https://example.com/1",
@@ -218,41 +241,33 @@ class TestSmartPipeline:
             court_code="FCA",
         )
         case.ensure_id()
-        save_cases_csv([case], str(tmp_path))
+        save_cases_csv([case], output_dir)
 
         config = self._make_config(databases=[], fix_year_zero=True)
-        pipeline = SmartPipeline(config, str(tmp_path))
+        pipeline = SmartPipeline(config, output_dir)
         pipeline._run_clean_phase()
 
-        from immi_case_downloader.storage import load_all_cases
-        cases = load_all_cases(str(tmp_path))
-        assert cases[0].year == 2023
+        assert saved_cases[-1][0].year == 2023
 
     @patch("immi_case_downloader.sources.austlii.AustLIIScraper")
-    def test_clean_phase_dedup(self, mock_cls, tmp_path):
+    def test_clean_phase_dedup(self, mock_cls, output_dir, saved_cases):
         """Clean phase removes duplicate URLs."""
-        ensure_output_dirs(str(tmp_path))
         case1 = ImmigrationCase(citation="A", url="https://example.com/1", court_code="AATA")
         case2 = ImmigrationCase(citation="B", url="https://example.com/1", court_code="AATA")
         case1.ensure_id()
         case2.case_id = "different_id"
-        save_cases_csv([case1, case2], str(tmp_path))
+        save_cases_csv([case1, case2], output_dir)
 
         config = self._make_config(databases=[], deduplicate=True)
-        pipeline = SmartPipeline(config, str(tmp_path))
+        pipeline = SmartPipeline(config, output_dir)
         pipeline._run_clean_phase()
 
-        from immi_case_downloader.storage import load_all_cases
-        cases = load_all_cases(str(tmp_path))
-        assert len(cases) == 1
+        assert len(saved_cases[-1]) == 1
 
-    def test_stop_requested(self, tmp_path):
+    def test_stop_requested(self, output_dir):
         """Pipeline stops when stop is requested."""
-        ensure_output_dirs(str(tmp_path))
-        save_cases_csv([], str(tmp_path))
-
         config = self._make_config(databases=[])
-        pipeline = SmartPipeline(config, str(tmp_path))
+        pipeline = SmartPipeline(config, output_dir)
 
         pipeline.request_stop()
         with pipeline._lock:
@@ -40,20 +40,18 @@ class TestThreadSafety:
         assert isinstance(webapp._job_lock, type(threading.Lock()))
 
     def test_concurrent_job_start_reflected_in_api(self, client):
-        """While a job holds the lock, /api/v1/job-status reflects running=True."""
-        from immi_case_downloader import webapp
+        """A job marked running is reflected in /api/v1/job-status.
+
+        The autouse ``reset_job_state`` fixture restores the idle status.
+        """
+        from immi_case_downloader.web.jobs import job_manager
 
-        with webapp._job_lock:
-            webapp._job_status["running"] = True
+        job_manager.update(running=True)
 
-        try:
-            resp = client.get("/api/v1/job-status")
-            assert resp.status_code == 200
-            data = resp.get_json()
-            assert data["running"] is True
-        finally:
-            with webapp._job_lock:
-                webapp._job_status["running"] = False
+        resp = client.get("/api/v1/job-status")
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert data["running"] is True
 
     def test_job_status_api_returns_consistent_snapshot(self, client):
         """GET /api/v1/job-status should return a snapshot, not a live reference."""
@@ -78,6 +76,17 @@ class TestThreadSafety:
         assert fresh["errors"] == ["transient"]
         assert fresh["progress"] == "Testing"
 
+    def test_job_manager_snapshot_copies_nested_values(self):
+        """Values outside the scalar/list-of-scalars fast path are deep-copied too."""
+        from immi_case_downloader.web.job_manager import JobManager
+
+        manager = JobManager(lambda: {"running": False, "results": [{"id": 1}], "meta": {"k": [1]}})
+        snapshot = manager.snapshot()
+        snapshot["results"][0]["id"] = 2
+        snapshot["meta"]["k"].append(2)
+
+        assert manager.snapshot() == {"running": False, "results": [{"id": 1}], "meta": {"k": [1]}}
+
     def test_job_manager_reset_preserves_legacy_status_dict_identity(self):
         """Legacy imports of _job_status should keep pointing at the same dict object."""
         from immi_case_downloader.web.jobs import job_manager, _job_status
@@ -149,6 +158,15 @@ class TestSafeIntFloat:
         assert safe_int("-5", default=0, min_val=0, max_val=100) == 0
         assert safe_int("50", default=0, min_val=0, max_val=100) == 50
 
+    def test_safe_int_numeric_inputs(self):
+        from immi_case_downloader.webapp import safe_int
+        assert safe_int(42, default=0, max_val=10) == 10
+        assert safe_int(True, default=0) == 1
+        assert safe_int(3.9, default=0) == 3
+        assert safe_int(" 7 ", default=0) == 7
+        # The default is clamped like any other value
+        assert safe_int("x", default=0, min_val=1) == 1
+
     def test_safe_float_valid(self):
         from immi_case_downloader.webapp import safe_float
         assert safe_float("1.5", default=0.0) == 1.5
@@ -195,6 +213,21 @@ class TestPathTraversal:
         result = get_case_full_text(case, base_dir=str(populated_dir))
         assert result is None, "Absolute path outside output dir should be blocked"
 
+    def test_sibling_dir_sharing_prefix_blocked(self, populated_dir, sample_cases):
+        """A directory whose name merely starts with the output dir's is outside it."""
+        sibling = populated_dir.parent / (populated_dir.name + "_evil")
+        sibling.mkdir()
+        (sibling / "secret.txt").write_text("secret", encoding="utf-8")
+        case = sample_cases[0]
+        case.full_text_path = str(sibling / "secret.txt")
+        assert get_case_full_text(case, base_dir=str(populated_dir)) is None
+
+    def test_nul_byte_in_path_blocked(self, populated_dir, sample_cases):
+        """A path containing a NUL byte is rejected before it is resolved."""
+        case = sample_cases[0]
+        case.full_text_path = str(populated_dir / "case_texts" / "a.txt\0.png")
+        assert get_case_full_text(case, base_dir=str(populated_dir)) is None
+
     def test_valid_path_within_output_dir(self, populated_dir, sample_cases):
         """Valid file path within output dir should be readable."""
         case = sample_cases[0]
@@ -264,62 +297,101 @@ class TestAtomicWrites:
     def test_csv_write_atomic(self, populated_dir, sample_cases):
         """If write fails mid-way, original CSV should remain intact."""
         csv_path = os.path.join(str(populated_dir), "immigration_cases.csv")
-        tmp_path = csv_path + ".tmp"
 
         # Save initial data
         save_cases_csv(sample_cases, str(populated_dir))
         original_size = os.path.getsize(csv_path)
 
-        # Simulate a write failure on the .tmp file
-        original_to_csv = __import__("pandas").DataFrame.to_csv
-
-        def failing_to_csv(self, path, **kwargs):
-            if str(path).endswith(".tmp"):
-                raise IOError("disk full")
-            return original_to_csv(self, path, **kwargs)
-
-        with patch("pandas.DataFrame.to_csv", failing_to_csv):
-            try:
+        # Simulate a failure while rows are being written to the temp file
+        with patch(
+            "immi_case_downloader.storage._write_cases_csv", side_effect=IOError("disk full")
+        ):
+            with pytest.raises(IOError):
                 save_cases_csv(sample_cases[:1], str(populated_dir))
-            except IOError:
-                pass
 
         # Original CSV should still be intact (atomic: .tmp failed, original untouched)
         assert os.path.exists(csv_path)
         assert os.path.getsize(csv_path) == original_size
         # No leftover .tmp file
-        assert not os.path.exists(tmp_path)
+        assert not [f for f in os.listdir(str(populated_dir)) if f.endswith(".tmp")]
 
     def test_json_write_atomic(self, populated_dir, sample_cases):
         """If JSON write fails, original file should remain."""
         json_path = os.path.join(str(populated_dir), "immigration_cases.json")
-        tmp_path = json_path + ".tmp"
 
         save_cases_json(sample_cases, str(populated_dir))
         with open(json_path) as f:
             original_content = f.read()
 
-        # Mock open to fail only for .tmp files
-        real_open = open
-
-        def failing_open(path, *args, **kwargs):
-            if str(path).endswith(".tmp"):
-                raise IOError("disk full")
-            return real_open(path, *args, **kwargs)
-
-        with patch("builtins.open", failing_open):
-            try:
+        # Simulate a failure while the temp file is being written
+        with patch(
+            "immi_case_downloader.storage._dumps_json", side_effect=IOError("disk full")
+        ):
+            with pytest.raises(IOError):
                 save_cases_json(sample_cases[:1], str(populated_dir))
-            except IOError:
-                pass
 
         # Original JSON should still be intact
         assert os.path.exists(json_path)
         with open(json_path) as f:
             assert f.read() == original_content
+        assert not [f for f in os.listdir(str(populated_dir)) if f.endswith(".tmp")]
 
     def test_csv_no_leftover_tmp(self, populated_dir, sample_cases):
         """Successful write should not leave .tmp files behind."""
         save_cases_csv(sample_cases, str(populated_dir))
         tmp_files = [f for f in os.listdir(str(populated_dir)) if f.endswith(".tmp")]
         assert len(tmp_files) == 0, f"Leftover .tmp files: {tmp_files}"
+
+    def test_failed_sync_removes_tmp(self, populated_dir, sample_cases):
+        """A failure after the .tmp file exists must clean it up and keep the original."""
+        csv_path = os.path.join(str(populated_dir), "immigration_cases.csv")
+        save_cases_csv(sample_cases, str(populated_dir))
+        original_size = os.path.getsize(csv_path)
+
+        with patch("immi_case_downloader.storage.os.fsync", side_effect=OSError("EIO")):
+            with pytest.raises(OSError):
+                save_cases_csv(sample_cases[:1], str(populated_dir))
+
+        assert os.path.getsize(csv_path) == original_size
+        assert not [f for f in os.listdir(str(populated_dir)) if f.endswith(".tmp")]
+
+    def test_concurrent_writers_use_distinct_tmp_files(self, populated_dir, sample_cases):
+        """Each write gets its own temp file, so parallel saves cannot interleave."""
+        seen = []
+        real_replace = os.replace
+
+        def recording_replace(src, dst):
+            seen.append(src)
+            return real_replace(src, dst)
+
+        with patch("immi_case_downloader.storage.os.replace", recording_replace):
+            save_cases_csv(sample_cases, str(populated_dir))
+            save_cases_csv(sample_cases, str(populated_dir))
+        assert len(set(seen)) == 2
+        assert all(os.path.dirname(p) == str(populated_dir) for p in seen)
+
+    @pytest.mark.skipif(not hasattr(os, "fchmod"), reason="POSIX file modes only")
+    def test_replaced_file_keeps_permissions(self, populated_dir, sample_cases):
+        """The temp file must not narrow the target's mode to mkstemp's 0600."""
+        csv_path = os.path.join(str(populated_dir), "immigration_cases.csv")
+        os.chmod(csv_path, 0o644)
+        save_cases_csv(sample_cases, str(populated_dir))
+        assert os.stat(csv_path).st_mode & 0o777 == 0o644
+
+    @pytest.mark.skipif(not hasattr(os, "fchmod"), reason="POSIX file modes only")
+    def test_new_file_gets_umask_mode(self, tmp_path, sample_cases):
+        """A newly created file gets the mode open() would give it."""
+        umask = os.umask(0)
+        os.umask(umask)
+        save_cases_csv(sample_cases, str(tmp_path))
+        csv_path = os.path.join(str(tmp_path), "immigration_cases.csv")
+        assert os.stat(csv_path).st_mode & 0o777 == 0o666 & ~umask
+
+    def test_non_durable_write_skips_fsync(self, populated_dir, sample_cases):
+        """durable=False keeps the tmp+rename but issues no fsync."""
+        with patch("immi_case_downloader.storage.os.fsync") as fsync:
+            save_cases_csv(sample_cases, str(populated_dir), durable=False)
+            save_cases_json(sample_cases, str(populated_dir), durable=False)
+        fsync.assert_not_called()
+        assert len(load_all_cases(str(populated_dir))) == len(sample_cases)
+        assert not [f for f in os.listdir(str(populated_dir)) if f.endswith(".tmp")]
@@ -2,9 +2,12 @@
 
 import json
 import os
+import threading
+from unittest.mock import patch
 
 import pytest
 
+from immi_case_downloader import storage
 from immi_case_downloader.models import ImmigrationCase
 from immi_case_downloader.storage import (
     CASE_FIELDS,
@@ -17,6 +20,7 @@ from immi_case_downloader.storage import (
     get_case_by_id,
     update_case,
     delete_case,
+    deferred_case_writes,
     add_case_manual,
     get_case_full_text,
     get_statistics,
@@ -53,6 +57,22 @@ class TestCsvRoundTrip:
         records = load_cases_csv(str(tmp_path))
         assert set(records[0].keys()) == set(CASE_FIELDS)
 
+    def test_load_reads_cells_as_text(self, tmp_path, sample_cases):
+        ensure_output_dirs(str(tmp_path))
+        save_cases_csv(sample_cases, str(tmp_path))
+        record = load_cases_csv(str(tmp_path))[0]
+        assert record["year"] == "2024"
+        assert record["judges"] == ""
+
+    def test_load_all_cases_parses_float_formatted_year(self, tmp_path):
+        # pandas-based maintenance scripts write a year column with gaps as floats
+        ensure_output_dirs(str(tmp_path))
+        (tmp_path / "immigration_cases.csv").write_text(
+            "case_id,citation,year\na1,[2024] AATA 1,2024.0\na2,[2023] AATA 2,\n",
+            encoding="utf-8",
+        )
+        assert [c.year for c in load_all_cases(str(tmp_path))] == [2024, 0]
+
     def test_load_all_cases_returns_objects(self, populated_dir):
         cases = load_all_cases(str(populated_dir))
         assert all(isinstance(c, ImmigrationCase) for c in cases)
@@ -73,6 +93,32 @@ class TestCsvRoundTrip:
         assert loaded[0].judges == ""
         assert loaded[0].year == 2024
 
+    def test_load_all_cases_matches_from_dict(self, tmp_path):
+        """The bulk loader agrees with from_dict, including legacy cells."""
+        ensure_output_dirs(str(tmp_path))
+        csv_path = tmp_path / "immigration_cases.csv"
+        csv_path.write_text(
+            "case_id,citation,year,judges,url\n"
+            "a1,[2024] AATA 1,2024.0,,https://example.com/1\n"
+            "a2,[2023] AATA 2,,nan,https://example.com/2\n"
+            "a3,[2022] AATA 3,bad,Member X,https://example.com/3\n",
+            encoding="utf-8",
+        )
+        loaded = load_all_cases(str(tmp_path))
+        expected = [ImmigrationCase.from_dict(r) for r in load_cases_csv(str(tmp_path))]
+        assert [c.to_dict() for c in loaded] == [c.to_dict() for c in expected]
+        assert [c.year for c in loaded] == [2024, 0, 0]
+        assert loaded[1].judges == ""
+
+    def test_load_all_cases_ignores_unknown_columns(self, tmp_path):
+        ensure_output_dirs(str(tmp_path))
+        (tmp_path / "immigration_cases.csv").write_text(
+            "case_id,citation,legacy_col\na1,[2024] AATA 1,x\n", encoding="utf-8"
+        )
+        (case,) = load_all_cases(str(tmp_path))
+        assert case.citation == "[2024] AATA 1"
+        assert not hasattr(case, "legacy_col")
+
 
 class TestSaveJson:
     def test_structure(self, tmp_path, sample_cases):
@@ -94,6 +140,15 @@ class TestSaveJson:
         assert data["year_range"]["min"] == 2024
         assert data["year_range"]["max"] == 2024
 
+    def test_stdlib_fallback_matches(self, tmp_path, sample_cases, monkeypatch):
+        """Output is byte-identical with and without orjson installed."""
+        ensure_output_dirs(str(tmp_path))
+        with open(save_cases_json(sample_cases, str(tmp_path)), "rb") as f:
+            default_bytes = f.read()
+        monkeypatch.setattr(storage, "orjson", None)
+        with open(save_cases_json(sample_cases, str(tmp_path)), "rb") as f:
+            assert f.read() == default_bytes
+
 
 class TestSaveCaseText:
     def test_file_content(self, tmp_path, sample_case):
@@ -140,6 +195,13 @@ class TestGetCaseById:
     def test_not_found(self, populated_dir):
         assert get_case_by_id("nonexistent", str(populated_dir)) is None
 
+    def test_duplicate_id_returns_first_row(self, tmp_path):
+        ensure_output_dirs(str(tmp_path))
+        first = ImmigrationCase(case_id="dup", citation="first")
+        second = ImmigrationCase(case_id="dup", citation="second")
+        save_cases_csv([first, second], str(tmp_path))
+        assert get_case_by_id("dup", str(tmp_path)).citation == "first"
+
 
 class TestUpdateCase:
     def test_persists_changes(self, populated_dir, sample_cases):
@@ -158,15 +220,102 @@ class TestUpdateCase:
 class TestDeleteCase:
     def test_removes_case(self, populated_dir, sample_cases):
         target = sample_cases[0]
-        original_count = len(load_all_cases(str(populated_dir)))
+        before_ids = {c.case_id for c in load_all_cases(str(populated_dir))}
         result = delete_case(target.case_id, str(populated_dir))
         assert result is True
-        assert len(load_all_cases(str(populated_dir))) == original_count - 1
+        after_ids = {c.case_id for c in load_all_cases(str(populated_dir))}
+        assert after_ids == before_ids - {target.case_id}
 
     def test_returns_false_for_missing(self, populated_dir):
         assert delete_case("nonexistent", str(populated_dir)) is False
 
 
+class TestDeferredCaseWrites:
+    def test_single_rewrite_for_many_mutations(self, populated_dir, sample_cases):
+        base = str(populated_dir)
+        with patch("immi_case_downloader.storage.save_cases_csv", wraps=save_cases_csv) as save:
+            with deferred_case_writes(base):
+                update_case(sample_cases[0].case_id, {"tags": "a"}, base)
+                update_case(sample_cases[1].case_id, {"tags": "b"}, base)
+                assert delete_case(sample_cases[2].case_id, base) is True
+                # Reads inside the block see the pending writes
+                assert get_case_by_id(sample_cases[0].case_id, base).tags == "a"
+                assert get_case_by_id(sample_cases[2].case_id, base) is None
+                save.assert_not_called()
+        save.assert_called_once()
+
+        reloaded = {c.case_id: c for c in load_all_cases(base)}
+        assert reloaded[sample_cases[1].case_id].tags == "b"
+        assert sample_cases[2].case_id not in reloaded
+
+    def test_flushes_when_block_raises(self, populated_dir, sample_cases):
+        base = str(populated_dir)
+        with pytest.raises(RuntimeError):
+            with deferred_case_writes(base):
+                update_case(sample_cases[0].case_id, {"user_notes": "kept"}, base)
+                raise RuntimeError("boom")
+        assert get_case_by_id(sample_cases[0].case_id, base).user_notes == "kept"
+
+    def test_other_threads_see_only_saved_state(self, populated_dir, sample_cases):
+        base = str(populated_dir)
+        target = sample_cases[0].case_id
+        seen = {}
+
+        def read_from_other_thread():
+            seen["tags"] = get_case_by_id(target, base).tags
+
+        with deferred_case_writes(base):
+            update_case(target, {"tags": "pending"}, base)
+            reader = threading.Thread(target=read_from_other_thread)
+            reader.start()
+            reader.join()
+            assert get_case_by_id(target, base).tags == "pending"
+
+        assert seen["tags"] == sample_cases[0].tags
+        assert get_case_by_id(target, base).tags == "pending"
+
+    def test_other_writers_wait_for_the_block(self, populated_dir, sample_cases):
+        base = str(populated_dir)
+        writer = threading.Thread(
+            target=delete_case, args=(sample_cases[1].case_id, base)
+        )
+        with deferred_case_writes(base):
+            update_case(sample_cases[0].case_id, {"tags": "batched"}, base)
+            writer.start()
+            writer.join(timeout=0.2)
+            assert writer.is_alive()  # blocked until the batch is saved
+        writer.join()
+
+        reloaded = {c.case_id: c for c in load_all_cases(base)}
+        assert reloaded[sample_cases[0].case_id].tags == "batched"
+        assert sample_cases[1].case_id not in reloaded
+
+    def test_add_case_manual_joins_the_batch(self, populated_dir, sample_cases):
+        base = str(populated_dir)
+        with deferred_case_writes(base):
+            update_case(sample_cases[0].case_id, {"tags": "batched"}, base)
+            added = add_case_manual({"title": "Added In Batch"}, base)
+            assert get_case_by_id(added.case_id, base).title == "Added In Batch"
+
+        reloaded = {c.case_id: c for c in load_all_cases(base)}
+        assert reloaded[added.case_id].title == "Added In Batch"
+        assert reloaded[sample_cases[0].case_id].tags == "batched"
+        assert len(reloaded) == len(sample_cases) + 1
+
+    def test_repository_save_many_joins_the_batch(self, populated_dir, sample_cases):
+        from immi_case_downloader.csv_repository import CsvRepository
+
+        repo = CsvRepository(str(populated_dir))
+        new_case = ImmigrationCase(url="https://example.com/batched", title="Saved In Batch")
+        with repo.deferred_writes():
+            repo.update(sample_cases[0].case_id, {"tags": "batched"})
+            assert repo.save_many([new_case]) == 1
+
+        reloaded = {c.case_id: c for c in load_all_cases(str(populated_dir))}
+        assert reloaded[new_case.case_id].title == "Saved In Batch"
+        assert reloaded[sample_cases[0].case_id].tags == "batched"
+
+
 class TestAddCaseManual:
     def test_assigns_id_and_source(self, populated_dir):
         original_count = len(load_all_cases(str(populated_dir)))
@@ -1,9 +1,11 @@
 """Tests for SupabaseRepository — fully mocked, no real Supabase connection."""
 
 import os
-from unittest.mock import MagicMock, patch, call
+from types import MappingProxyType
+from unittest.mock import MagicMock, call, create_autospec, patch
 
 import pytest
+from supabase import Client
 
 from immi_case_downloader.models import ImmigrationCase
 from immi_case_downloader.supabase_repository import (
@@ -15,67 +17,145 @@ from immi_case_downloader.supabase_repository import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+_CASE_DEFAULTS = MappingProxyType(dict(
+    case_id="abc123",
+    citation="[2024] AATA 100",
+    title="Smith v Minister",
+    court="Administrative Appeals Tribunal",
+    court_code="AATA",
+    date="2024-03-15",
+    year=2024,
+    url="https://austlii.edu.au/au/cases/cth/AATA/2024/100.html",
+    judges="Member Jones",
+    catchwords="visa refusal",
+    outcome="Affirmed",
+    visa_type="Subclass 866",
+    legislation="Migration Act 1958",
+    text_snippet="Tribunal affirms.",
+    full_text_path="",
+    source="AustLII",
+    user_notes="",
+    tags="",
+    case_nature="Visa Refusal",
+    legal_concepts="Character Test",
+))
+
+
 def _make_case(**overrides) -> ImmigrationCase:
-    defaults = dict(
-        case_id="abc123",
-        citation="[2024] AATA 100",
-        title="Smith v Minister",
-        court="Administrative Appeals Tribunal",
-        court_code="AATA",
-        date="2024-03-15",
-        year=2024,
-        url="https://austlii.edu.au/au/cases/cth/AATA/2024/100.html",
-        judges="Member Jones",
-        catchwords="visa refusal",
-        outcome="Affirmed",
-        visa_type="Subclass 866",
-        legislation="Migration Act 1958",
-        text_snippet="Tribunal affirms.",
-        full_text_path="",
-        source="AustLII",
-        user_notes="",
-        tags="",
-        case_nature="Visa Refusal",
-        legal_concepts="Character Test",
-    )
-    defaults.update(overrides)
-    return ImmigrationCase(**defaults)
+    return ImmigrationCase(**{**_CASE_DEFAULTS, **overrides})
+
+
+_BASE_ROW = MappingProxyType(_make_case().to_dict())
 
 
 def _case_row(**overrides) -> dict:
     """Return a dict mimicking a Supabase row."""
-    return _make_case(**overrides).to_dict()
+    return {**_BASE_ROW, **overrides}
+
+
+def _chain_table(client, *methods, execute_returns=None) -> MagicMock:
+    """Point ``client.table()`` at a fresh query mock whose *methods* chain.
+
+    Each named builder method returns the mock itself, mirroring the
+    supabase-py fluent API; ``execute()`` returns *execute_returns* when
+    given, otherwise tests set ``execute`` themselves (e.g. a side_effect).
+    """
+    table = MagicMock()
+    for name in methods:
+        getattr(table, name).return_value = table
+    if execute_returns is not None:
+        table.execute.return_value = execute_returns
+    client.table.return_value = table
+    return table
+
+
+class _Response:
+    """Stand-in for a Supabase API response: just ``data`` and ``count``."""
+
+    __slots__ = ("data", "count")
+
+    def __init__(self, data=None, count=None):
+        self.data = data if data is not None else []
+        self.count = count
 
 
 def _mock_response(data=None, count=None):
-    """Create a mock Supabase response object."""
-    resp = MagicMock()
-    resp.data = data if data is not None else []
-    resp.count = count
-    return resp
+    """Create a fake Supabase response object."""
+    return _Response(data, count)
+
+
+# Shared read-only responses for the common empty cases; the repository only
+# reads ``data``/``count`` from them. (``data=None`` is normalised to [].)
+_EMPTY_RESP = _mock_response()
+_EMPTY_COUNTED_RESP = _mock_response(count=0)
+
+
+class _RpcResult:
+    """Plain stand-in for an RPC query builder: ``limit()`` chains and
+    ``execute()`` returns a response carrying *data*.
+
+    Cheaper than a MagicMock tree; calls are still asserted on the
+    ``mock_client.rpc`` mock itself.
+    """
+
+    __slots__ = ("_response",)
+
+    def __init__(self, data):
+        self._response = _mock_response(data=data)
+
+    def limit(self, _count):
+        return self
+
+    def execute(self):
+        return self._response
 
 
 # ---------------------------------------------------------------------------
 # Fixture: mock the supabase create_client so no real connection is made
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def mock_client():
-    """Patch create_client and return the mock Supabase client."""
-    with patch.dict(os.environ, {
-        "SUPABASE_URL": "https://test.supabase.co",
-        "SUPABASE_SERVICE_ROLE_KEY": "test-key-12345",
-    }):
-        with patch("immi_case_downloader.supabase_repository.create_client") as mock_create:
-            client = MagicMock()
-            mock_create.return_value = client
-            yield client
+_REPO_OUTPUT_DIR = "/tmp/test_cases"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module", autouse=True)
+def _supabase_env():
+    """Supabase credentials for every test in the module, set once."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SUPABASE_URL", "https://test.supabase.co")
+        mp.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key-12345")
+        yield
+
+
+@pytest.fixture(scope="module")
+def mock_client(_supabase_env):
+    """Patch create_client once per module and return the mock Supabase client."""
+    with patch("immi_case_downloader.supabase_repository.create_client") as mock_create:
+        # Speccing against the real Client rejects calls to methods the
+        # SDK does not have and builds the method mocks up front.
+        client = create_autospec(Client, instance=True)
+        mock_create.return_value = client
+        yield client
+
+
+@pytest.fixture(scope="module")
 def repo(mock_client):
-    """SupabaseRepository with a mocked client."""
-    return SupabaseRepository(output_dir="/tmp/test_cases")
+    """SupabaseRepository with a mocked client, shared by the module's tests."""
+    return SupabaseRepository(output_dir=_REPO_OUTPUT_DIR)
+
+
+@pytest.fixture(scope="session")
+def full_page_rows():
+    """A full page (PAGE_MAX) of fake rows; read-only, so built once."""
+    return [_case_row(case_id=f"id{i}") for i in range(PAGE_MAX)]
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_repo(mock_client, repo):
+    """Give every test a clean client mock and repository state."""
+    yield
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    repo.__dict__.pop("_cached_columns", None)
+    repo._output_dir = _REPO_OUTPUT_DIR
 
 
 # ---------------------------------------------------------------------------
@@ -105,12 +185,7 @@ class TestInit:
 class TestLoadAll:
     def test_single_page(self, repo, mock_client):
         rows = [_case_row(case_id=f"id{i}") for i in range(3)]
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.limit.return_value = table
-        table.gt.return_value = table
+        table = _chain_table(mock_client, "select", "order", "limit", "gt")
         table.execute.side_effect = [
             _mock_response(data=[_case_row(case_id="schema")]),
             _mock_response(data=rows),
@@ -120,20 +195,14 @@ class TestLoadAll:
         assert len(cases) == 3
         assert cases[0].case_id == "id0"
 
-    def test_pagination(self, repo, mock_client):
+    def test_pagination(self, repo, mock_client, full_page_rows):
         """When first page is full (PAGE_MAX rows), should fetch next page."""
-        full_page = [_case_row(case_id=f"id{i}") for i in range(PAGE_MAX)]
         partial = [_case_row(case_id="last")]
 
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.limit.return_value = table
-        table.gt.return_value = table
+        table = _chain_table(mock_client, "select", "order", "limit", "gt")
         table.execute.side_effect = [
             _mock_response(data=[_case_row(case_id="schema")]),
-            _mock_response(data=full_page),
+            _mock_response(data=full_page_rows),
             _mock_response(data=partial),
         ]
 
@@ -144,15 +213,10 @@ class TestLoadAll:
         assert table.gt.call_count == 1
 
     def test_empty_db(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.limit.return_value = table
-        table.gt.return_value = table
+        table = _chain_table(mock_client, "select", "order", "limit", "gt")
         table.execute.side_effect = [
             _mock_response(data=[_case_row(case_id="schema")]),
-            _mock_response(data=[]),
+            _EMPTY_RESP,
         ]
 
         assert repo.load_all() == []
@@ -163,27 +227,15 @@ class TestLoadAll:
 # ---------------------------------------------------------------------------
 
 class TestGetById:
-    def test_found(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.eq.return_value = table
-        table.maybe_single.return_value = table
-        table.execute.return_value = _mock_response(data=_case_row())
+    @pytest.mark.parametrize("response,expected_id", [
+        pytest.param(_mock_response(data=_case_row()), "abc123", id="found"),
+        pytest.param(_EMPTY_RESP, None, id="not-found"),
+    ])
+    def test_lookup(self, repo, mock_client, response, expected_id):
+        _chain_table(mock_client, "select", "eq", "maybe_single", execute_returns=response)
 
         case = repo.get_by_id("abc123")
-        assert case is not None
-        assert case.case_id == "abc123"
-
-    def test_not_found(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.eq.return_value = table
-        table.maybe_single.return_value = table
-        table.execute.return_value = _mock_response(data=None)
-
-        assert repo.get_by_id("missing") is None
+        assert (case.case_id if case else None) == expected_id
 
 
 # ---------------------------------------------------------------------------
@@ -193,22 +245,16 @@ class TestGetById:
 class TestSaveMany:
     def test_single_batch(self, repo, mock_client):
         cases = [_make_case(case_id=f"id{i}") for i in range(3)]
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.upsert.return_value = table
-        table.execute.return_value = _mock_response()
+        table = _chain_table(mock_client, "upsert", execute_returns=_EMPTY_RESP)
 
         count = repo.save_many(cases)
         assert count == 3
-        table.upsert.assert_called_once()
+        assert table.upsert.call_count == 1
 
     def test_multiple_batches(self, repo, mock_client):
         """Cases exceeding BATCH_SIZE should be split into multiple upserts."""
         cases = [_make_case(case_id=f"id{i}") for i in range(BATCH_SIZE + 10)]
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.upsert.return_value = table
-        table.execute.return_value = _mock_response()
+        table = _chain_table(mock_client, "upsert", execute_returns=_EMPTY_RESP)
 
         count = repo.save_many(cases)
         assert count == BATCH_SIZE + 10
@@ -223,55 +269,41 @@ class TestSaveMany:
 # ---------------------------------------------------------------------------
 
 class TestUpdate:
-    def test_allowed_fields(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.update.return_value = table
-        table.eq.return_value = table
-        table.execute.return_value = _mock_response(data=[{"case_id": "abc123"}])
+    @pytest.mark.parametrize("updates,expected_payload", [
+        pytest.param(
+            {"title": "New Title", "user_notes": "note"},
+            {"title": "New Title", "user_notes": "note"},
+            id="allowed",
+        ),
+        pytest.param({"title": "OK", "case_id": "bad"}, {"title": "OK"}, id="mixed"),
+    ])
+    def test_sends_only_allowed_fields(self, repo, mock_client, updates, expected_payload):
+        table = _chain_table(
+            mock_client, "update", "eq",
+            execute_returns=_mock_response(data=[{"case_id": "abc123"}]),
+        )
 
-        result = repo.update("abc123", {"title": "New Title", "user_notes": "note"})
-        assert result is True
-        table.update.assert_called_once_with({"title": "New Title", "user_notes": "note"})
+        assert repo.update("abc123", updates) is True
+        table.update.assert_called_once_with(expected_payload)
 
     def test_blocked_fields(self, repo, mock_client):
         result = repo.update("abc123", {"case_id": "hacked", "unknown_field": "x"})
         assert result is False
 
-    def test_mixed_fields(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.update.return_value = table
-        table.eq.return_value = table
-        table.execute.return_value = _mock_response(data=[{"case_id": "abc123"}])
-
-        result = repo.update("abc123", {"title": "OK", "case_id": "bad"})
-        assert result is True
-        table.update.assert_called_once_with({"title": "OK"})
-
 
 # ---------------------------------------------------------------------------
 # Tests: delete
 # ---------------------------------------------------------------------------
 
 class TestDelete:
-    def test_success(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.delete.return_value = table
-        table.eq.return_value = table
-        table.execute.return_value = _mock_response(data=[{"case_id": "abc123"}])
+    @pytest.mark.parametrize("response,expected", [
+        pytest.param(_mock_response(data=[{"case_id": "abc123"}]), True, id="success"),
+        pytest.param(_EMPTY_RESP, False, id="not-found"),
+    ])
+    def test_delete(self, repo, mock_client, response, expected):
+        _chain_table(mock_client, "delete", "eq", execute_returns=response)
 
-        assert repo.delete("abc123") is True
-
-    def test_not_found(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.delete.return_value = table
-        table.eq.return_value = table
-        table.execute.return_value = _mock_response(data=[])
-
-        assert repo.delete("missing") is False
+        assert repo.delete("abc123") is expected
 
 
 # ---------------------------------------------------------------------------
@@ -280,10 +312,7 @@ class TestDelete:
 
 class TestAdd:
     def test_sets_source(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.upsert.return_value = table
-        table.execute.return_value = _mock_response()
+        _chain_table(mock_client, "upsert", execute_returns=_EMPTY_RESP)
 
         case = _make_case(source="")
         result = repo.add(case)
@@ -306,9 +335,7 @@ class TestStatistics:
             "with_full_text": 10,
             "sources": ["AustLII"],
         }
-        mock_client.rpc.return_value = MagicMock(
-            execute=MagicMock(return_value=_mock_response(data=stats_data))
-        )
+        mock_client.rpc.return_value = _RpcResult(stats_data)
 
         result = repo.get_statistics()
         assert result["total"] == 100
@@ -324,9 +351,7 @@ class TestStatistics:
 class TestGetExistingUrls:
     def test_returns_set(self, repo, mock_client):
         urls = ["https://a.com", "https://b.com"]
-        mock_client.rpc.return_value = MagicMock(
-            execute=MagicMock(return_value=_mock_response(data=urls))
-        )
+        mock_client.rpc.return_value = _RpcResult(urls)
 
         result = repo.get_existing_urls()
         assert isinstance(result, set)
@@ -340,13 +365,10 @@ class TestGetExistingUrls:
 class TestFilterCases:
     def test_basic_filter(self, repo, mock_client):
         rows = [_case_row(case_id="f1")]
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.eq.return_value = table
-        table.order.return_value = table
-        table.range.return_value = table
-        table.execute.return_value = _mock_response(data=rows, count=1)
+        table = _chain_table(
+            mock_client, "select", "eq", "order", "range",
+            execute_returns=_mock_response(data=rows, count=1),
+        )
 
         cases, total = repo.filter_cases(court="AATA", page=1, page_size=50)
         assert len(cases) == 1
@@ -354,57 +376,43 @@ class TestFilterCases:
         table.eq.assert_called_with("court_code", "AATA")
 
     def test_text_search_filter(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.text_search.return_value = table
-        table.order.return_value = table
-        table.range.return_value = table
-        table.execute.return_value = _mock_response(data=[], count=0)
+        table = _chain_table(
+            mock_client, "select", "text_search", "order", "range",
+            execute_returns=_EMPTY_COUNTED_RESP,
+        )
 
         repo.filter_cases(keyword="visa refusal")
         table.text_search.assert_called_once()
 
     def test_invalid_sort_defaults_to_year(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.range.return_value = table
-        table.execute.return_value = _mock_response(data=[], count=0)
+        table = _chain_table(
+            mock_client, "select", "order", "range",
+            execute_returns=_EMPTY_COUNTED_RESP,
+        )
 
         repo.filter_cases(sort_by="DROP TABLE", sort_dir="asc")
         table.order.assert_called_with("year", desc=False)
 
     def test_pagination_offset(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.range.return_value = table
-        table.execute.return_value = _mock_response(data=[], count=0)
+        table = _chain_table(
+            mock_client, "select", "order", "range",
+            execute_returns=_EMPTY_COUNTED_RESP,
+        )
 
         repo.filter_cases(page=3, page_size=20)
         table.range.assert_called_with(40, 59)
 
     def test_date_sort_degrades_to_year_for_stability(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.range.return_value = table
-        table.execute.return_value = _mock_response(data=[], count=0)
+        table = _chain_table(
+            mock_client, "select", "order", "range",
+            execute_returns=_EMPTY_COUNTED_RESP,
+        )
 
         repo.filter_cases(sort_by="date", sort_dir="desc")
         table.order.assert_called_with("year", desc=True)
 
     def test_list_cases_fast_skips_count_header(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.range.return_value = table
-        table.execute.return_value = _mock_response(data=[])
+        table = _chain_table(mock_client, "select", "order", "range", execute_returns=_EMPTY_RESP)
 
         repo.list_cases_fast(sort_by="date", page=1, page_size=5)
 
@@ -413,12 +421,10 @@ class TestFilterCases:
         assert "count" not in select_call.kwargs
 
     def test_list_cases_seek_uses_stable_year_case_id_order(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.limit.return_value = table
-        table.execute.return_value = _mock_response(data=[_case_row(case_id="s1", year=2024)])
+        table = _chain_table(
+            mock_client, "select", "order", "limit",
+            execute_returns=_mock_response(data=[_case_row(case_id="s1", year=2024)]),
+        )
 
         repo.list_cases_seek(sort_by="date", sort_dir="desc", page_size=5)
 
@@ -429,13 +435,10 @@ class TestFilterCases:
         table.limit.assert_called_with(5)
 
     def test_list_cases_seek_applies_anchor_or_filter(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.or_.return_value = table
-        table.limit.return_value = table
-        table.execute.return_value = _mock_response(data=[])
+        table = _chain_table(
+            mock_client, "select", "order", "or_", "limit",
+            execute_returns=_EMPTY_RESP,
+        )
 
         repo.list_cases_seek(
             sort_by="year",
@@ -453,24 +456,20 @@ class TestFilterCases:
             repo.list_cases_seek(keyword="minister")
 
     def test_count_cases_uses_planned_mode(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.eq.return_value = table
-        table.limit.return_value = table
-        table.execute.return_value = _mock_response(data=[{"case_id": "x"}], count=42)
+        table = _chain_table(
+            mock_client, "select", "eq", "limit",
+            execute_returns=_mock_response(data=[{"case_id": "x"}], count=42),
+        )
 
         total = repo.count_cases(court="AATA", count_mode="planned")
         assert total == 42
         table.select.assert_called_with("case_id", count="planned")
 
     def test_count_cases_invalid_mode_falls_back_to_planned(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.eq.return_value = table
-        table.limit.return_value = table
-        table.execute.return_value = _mock_response(data=[], count=0)
+        table = _chain_table(
+            mock_client, "select", "eq", "limit",
+            execute_returns=_EMPTY_COUNTED_RESP,
+        )
 
         repo.count_cases(count_mode="invalid-mode")
         table.select.assert_called_with("case_id", count="planned")
@@ -483,12 +482,10 @@ class TestFilterCases:
 class TestSearchText:
     def test_basic(self, repo, mock_client):
         rows = [_case_row()]
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.text_search.return_value = table
-        table.limit.return_value = table
-        table.execute.return_value = _mock_response(data=rows)
+        table = _chain_table(
+            mock_client, "select", "text_search", "limit",
+            execute_returns=_mock_response(data=rows),
+        )
 
         results = repo.search_text("visa refusal")
         assert len(results) == 1
@@ -502,12 +499,10 @@ class TestSearchText:
         assert repo.search_text("  ") == []
 
     def test_limit_clamped(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.text_search.return_value = table
-        table.limit.return_value = table
-        table.execute.return_value = _mock_response(data=[])
+        table = _chain_table(
+            mock_client, "select", "text_search", "limit",
+            execute_returns=_EMPTY_RESP,
+        )
 
         repo.search_text("test", limit=999)
         table.limit.assert_called_with(200)
@@ -520,18 +515,14 @@ class TestSearchText:
 class TestFindRelated:
     def test_calls_rpc(self, repo, mock_client):
         # First, get_by_id must return a case
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.eq.return_value = table
-        table.maybe_single.return_value = table
-        table.execute.return_value = _mock_response(data=_case_row())
+        _chain_table(
+            mock_client, "select", "eq", "maybe_single",
+            execute_returns=_mock_response(data=_case_row()),
+        )
 
         # Then RPC returns related cases
         related = [_case_row(case_id="rel1"), _case_row(case_id="rel2")]
-        mock_client.rpc.return_value = MagicMock(
-            execute=MagicMock(return_value=_mock_response(data=related))
-        )
+        mock_client.rpc.return_value = _RpcResult(related)
 
         results = repo.find_related("abc123", limit=5)
         assert len(results) == 2
@@ -544,12 +535,10 @@ class TestFindRelated:
         })
 
     def test_case_not_found(self, repo, mock_client):
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.eq.return_value = table
-        table.maybe_single.return_value = table
-        table.execute.return_value = _mock_response(data=None)
+        _chain_table(
+            mock_client, "select", "eq", "maybe_single",
+            execute_returns=_EMPTY_RESP,
+        )
 
         assert repo.find_related("missing") == []
 
@@ -561,12 +550,7 @@ class TestFindRelated:
 class TestExport:
     def test_export_csv_rows(self, repo, mock_client):
         rows = [_case_row(case_id="e1")]
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.limit.return_value = table
-        table.gt.return_value = table
+        table = _chain_table(mock_client, "select", "order", "limit", "gt")
         table.execute.side_effect = [
             _mock_response(data=[_case_row(case_id="schema")]),
             _mock_response(data=rows),
@@ -578,12 +562,7 @@ class TestExport:
 
     def test_export_json(self, repo, mock_client):
         rows = [_case_row(case_id="j1", year=2024)]
-        table = MagicMock()
-        mock_client.table.return_value = table
-        table.select.return_value = table
-        table.order.return_value = table
-        table.limit.return_value = table
-        table.gt.return_value = table
+        table = _chain_table(mock_client, "select", "order", "limit", "gt")
         table.execute.side_effect = [
             _mock_response(data=[_case_row(case_id="schema")]),
             _mock_response(data=rows),
@@ -607,9 +586,7 @@ class TestFilterOptions:
             "natures": ["Visa Refusal"],
             "tags_raw": ["important, urgent", "flagged"],
         }
-        mock_client.rpc.return_value = MagicMock(
-            execute=MagicMock(return_value=_mock_response(data=opts))
-        )
+        mock_client.rpc.return_value = _RpcResult(opts)
 
         result = repo.get_filter_options()
         assert "important" in result["tags"]
@@ -759,16 +736,11 @@ class TestLoadAnalyticsCasesHyperdrive:
     def test_falls_back_to_rest_when_no_conn(self, repo, mock_client):
         """When _get_hyperdrive_conn() returns None, uses Supabase REST pagination."""
         rows = [_case_row(case_id="rest1")]
-        table = MagicMock()
-        table.select.return_value = table
-        table.order.return_value = table
-        table.limit.return_value = table
-        table.gt.return_value = table
+        table = _chain_table(mock_client, "select", "order", "limit", "gt")
         table.execute.side_effect = [
             _mock_response(data=[_case_row(case_id="schema")]),
             _mock_response(data=rows),
         ]
-        mock_client.table.return_value = table
 
         with patch("immi_case_downloader.supabase_repository._get_hyperdrive_conn",
                    return_value=None):
@@ -0,0 +1,53 @@
+"""Tests for the baseline comparison in validate_extraction.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from validate_extraction import compare_to_baseline
+
+
+def _write_csv(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _current(rows: list[dict]) -> pd.DataFrame:
+    return pd.DataFrame(rows, dtype=str).fillna("")
+
+
+def test_counts_regressions_and_improvements(tmp_path, capsys) -> None:
+    baseline = _write_csv(
+        tmp_path / "baseline.csv",
+        "case_id,applicant_name,respondent\n"
+        "a,Smith,Minister\n"
+        "b,,Minister\n"
+        ",Ghost,Ghost\n",  # no case_id: never matches
+    )
+    current = _current([
+        {"case_id": "a", "applicant_name": "", "respondent": "Minister"},
+        {"case_id": "b", "applicant_name": "Jones", "respondent": "Minister"},
+        {"case_id": "", "applicant_name": "", "respondent": ""},
+    ])
+
+    compare_to_baseline(current, baseline)
+
+    out = capsys.readouterr().out
+    assert "applicant_name" in out and "reg:1 imp:1" in out
+    assert "Total regressions: 1, improvements: 1" in out
+
+
+def test_baseline_without_case_id_column(tmp_path, capsys) -> None:
+    baseline = _write_csv(
+        tmp_path / "baseline.csv",
+        "applicant_name,respondent\nSmith,Minister\n",
+    )
+    current = _current([{"case_id": "a", "applicant_name": "Smith", "respondent": ""}])
+
+    compare_to_baseline(current, baseline)
+
+    out = capsys.readouterr().out
+    assert "0 →       1" in out  # nothing in the baseline matched
+    assert "Total regressions: 0, improvements: 1" in out
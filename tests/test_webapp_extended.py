@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 
 # ── Route status codes ─────────────────────────────────────────────────────
 
@@ -9,31 +11,23 @@ import json
 class TestRouteStatusCodes:
     """Verify routes return expected status codes under the SPA-at-root architecture."""
 
-    # UI routes → 200 (served by React SPA catch-all)
-    def test_dashboard_serves_spa(self, client):
-        assert client.get("/").status_code == 200
-
-    def test_cases_serves_spa(self, client):
-        assert client.get("/cases").status_code == 200
-
-    def test_case_add_serves_spa(self, client):
-        assert client.get("/cases/add").status_code == 200
-
-    def test_search_serves_spa(self, client):
-        assert client.get("/search").status_code == 200
-
-    def test_download_serves_spa(self, client):
-        assert client.get("/download").status_code == 200
-
-    def test_pipeline_serves_spa(self, client):
-        assert client.get("/pipeline").status_code == 200
-
-    def test_data_dictionary_serves_spa(self, client):
-        assert client.get("/data-dictionary").status_code == 200
-
-    def test_unknown_deep_path_serves_spa(self, client):
-        """Any unknown path falls through to React router (200, not 404)."""
-        assert client.get("/some/nonexistent/route").status_code == 200
+    @pytest.mark.parametrize("path,expected", [
+        # UI routes → 200 (served by React SPA catch-all)
+        ("/", 200),
+        ("/cases", 200),
+        ("/cases/add", 200),
+        ("/search", 200),
+        ("/download", 200),
+        ("/pipeline", 200),
+        ("/data-dictionary", 200),
+        # Any unknown path falls through to React router (200, not 404)
+        ("/some/nonexistent/route", 200),
+        # Export endpoints at /api/v1/*
+        ("/api/v1/export/csv", 200),
+        ("/api/v1/export/json", 200),
+    ], ids=lambda v: v if isinstance(v, str) else None)
+    def test_route_status(self, client, path, expected):
+        assert client.get(path).status_code == expected
 
     # JSON API routes → 200 (at /api/v1/*)
     def test_job_status_api_ok(self, client):
@@ -46,12 +40,6 @@ class TestRouteStatusCodes:
         assert resp.status_code == 200
         assert "running" in resp.get_json()
 
-    def test_export_csv_ok(self, client):
-        assert client.get("/api/v1/export/csv").status_code == 200
-
-    def test_export_json_ok(self, client):
-        assert client.get("/api/v1/export/json").status_code == 200
-
     def test_api_path_not_caught_by_spa(self, client):
         """API paths are NOT served as SPA — they return JSON or 404."""
         resp = client.get("/api/v1/stats")
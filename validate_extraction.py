@@ -13,11 +13,12 @@ Usage:
 """
 
 import argparse
-import csv
 import re
-from collections import Counter
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 CSV_PATH = Path("downloaded_cases/immigration_cases.csv")
 
 STRUCTURED_FIELDS = [
@@ -32,37 +33,41 @@ STRUCTURED_FIELDS = [
     "legal_test_applied",
 ]
 
-# Known garbage patterns for country_of_origin
-COUNTRY_GARBAGE_PATTERNS = [
-    re.compile(r"MEMBER\s*:", re.IGNORECASE),
-    re.compile(r"CASE\s+NUMBER\s*:", re.IGNORECASE),
-    re.compile(r"HOME\s+AFFAIRS\s*:", re.IGNORECASE),
-    re.compile(r"TRIBUNAL\s+MEMBER\s*:", re.IGNORECASE),
-    re.compile(r":\s*$"),
-]
+# Known garbage patterns for country_of_origin, fused into one alternation so
+# each value is scanned once ("TRIBUNAL MEMBER:" is covered by "MEMBER:").
+COUNTRY_GARBAGE_RE = re.compile(
+    r"(?:MEMBER|CASE\s+NUMBER|HOME\s+AFFAIRS)\s*:|:\s*$", re.IGNORECASE
+)
 
 
-def load_csv(path: Path) -> list[dict]:
-    with open(path, "r", encoding="utf-8-sig") as f:
-        return list(csv.DictReader(f))
+def load_csv(path: Path) -> pd.DataFrame:
+    # Every cell as text; empty cells stay "" rather than becoming NaN.
+    return pd.read_csv(
+        path, encoding="utf-8-sig", dtype=str, keep_default_na=False, na_filter=False
+    )
 
 
-def is_garbage_country(val: str) -> bool:
-    if not val:
-        return False
-    for pat in COUNTRY_GARBAGE_PATTERNS:
-        if pat.search(val):
-            return True
-    if len(val) > 60:
-        return True
-    return False
+def _col(df: pd.DataFrame, field: str) -> pd.Series:
+    """Column *field*, or all-empty strings when the CSV lacks it."""
+    if field in df.columns:
+        return df[field]
+    return pd.Series("", index=df.index, dtype=str)
 
 
-def print_fill_rates(rows: list[dict], court_filter: str = "", label: str = ""):
-    total = len(rows)
+def _filled(df: pd.DataFrame, field: str) -> pd.Series:
+    """Boolean mask of rows with a non-blank *field*."""
+    return _col(df, field).str.strip() != ""
+
+
+def _garbage_country(country: pd.Series) -> pd.Series:
+    """Boolean mask of country_of_origin values that are overlong or match a garbage pattern."""
+    return (country.str.len() > 60) | country.str.contains(COUNTRY_GARBAGE_RE)
+
+
+def print_fill_rates(rows: pd.DataFrame, court_filter: str = "", label: str = ""):
     if court_filter:
-        rows = [r for r in rows if r.get("court_code", "") == court_filter]
-        total = len(rows)
+        rows = rows[_col(rows, "court_code") == court_filter]
+    total = len(rows)
 
     title = f"Fill Rates{' — ' + label if label else ''}{' (' + court_filter + ')' if court_filter else ''}"
     print(f"\n{'='*70}")
@@ -72,17 +77,16 @@ def print_fill_rates(rows: list[dict], court_filter: str = "", label: str = ""):
     print()
 
     for field in STRUCTURED_FIELDS:
-        if field not in rows[0]:
+        if field not in rows.columns:
             print(f"  {field:30s}: (field not in CSV)")
             continue
-        filled = sum(1 for r in rows if r.get(field, "").strip())
+        filled = int(_filled(rows, field).sum())
         pct = filled / total * 100 if total > 0 else 0
         bar = "█" * int(pct / 5) + "░" * (20 - int(pct / 5))
         print(f"  {field:30s}: {filled:>8,} / {total:,} = {pct:5.1f}% {bar}")
 
 
-def print_court_breakdown(rows: list[dict]):
-    courts = sorted(set(r.get("court_code", "?") for r in rows))
+def print_court_breakdown(rows: pd.DataFrame):
     print(f"\n{'='*70}")
     print("Fill Rates by Court")
     print(f"{'='*70}")
@@ -90,15 +94,15 @@ def print_court_breakdown(rows: list[dict]):
     print(header)
     print("-" * 70)
 
-    for court in courts:
-        court_rows = [r for r in rows if r.get("court_code", "") == court]
-        total = len(court_rows)
-        if total == 0:
-            continue
+    fields = ["country_of_origin", "is_represented", "representative",
+              "visa_outcome_reason", "legal_test_applied"]
+    filled = pd.DataFrame({field: _filled(rows, field) for field in fields})
+    by_court = filled.groupby(_col(rows, "court_code"), sort=True)
+    counts = by_court.sum()
 
+    for court, total in by_court.size().items():
         def pct(field: str) -> str:
-            n = sum(1 for r in court_rows if r.get(field, "").strip())
-            return f"{n/total*100:.0f}%"
+            return f"{counts.at[court, field]/total*100:.0f}%"
 
         print(
             f"{court:<15} {total:>7,} {pct('country_of_origin'):>8} "
@@ -107,56 +111,76 @@ def print_court_breakdown(rows: list[dict]):
         )
 
 
-def check_garbage_values(rows: list[dict]):
+def check_garbage_values(rows: pd.DataFrame):
     print(f"\n{'='*70}")
     print("Garbage Value Check")
     print(f"{'='*70}")
 
     # Country garbage
-    garbage_country = [r for r in rows if is_garbage_country(r.get("country_of_origin", ""))]
+    country = _col(rows, "country_of_origin")
+    garbage_country = rows[_garbage_country(country)]
     print(f"\ncountry_of_origin garbage values: {len(garbage_country)}")
-    if garbage_country:
-        for r in garbage_country[:5]:
-            print(f"  [{r.get('citation','')}]: {repr(r.get('country_of_origin','')[:60])}")
-
-    # is_represented non-standard values
-    rep_values = Counter(r.get("is_represented", "") for r in rows)
+    if len(garbage_country):
+        for citation, value in zip(
+            _col(garbage_country, "citation")[:5], _col(garbage_country, "country_of_origin")[:5]
+        ):
+            print(f"  [{citation}]: {repr(value[:60])}")
+
+    # is_represented non-standard values (first-seen order, like a Counter)
+    rep_values = {
+        value: int(count)
+        for value, count in _col(rows, "is_represented").value_counts(sort=False).items()
+    }
     non_standard = {k: v for k, v in rep_values.items() if k not in ("Yes", "No", "")}
     if non_standard:
         print(f"\nis_represented non-standard values: {non_standard}")
     else:
-        valid_rep = {k: v for k, v in rep_values.items()}
-        print(f"\nis_represented values: {dict(sorted(valid_rep.items()))}")
+        print(f"\nis_represented values: {dict(sorted(rep_values.items()))}")
 
     # Country value lengths
-    long_countries = [r for r in rows if len(r.get("country_of_origin", "")) > 50]
-    if long_countries:
+    long_countries = country[country.str.len() > 50]
+    if len(long_countries):
         print(f"\nLong country values (>50 chars): {len(long_countries)}")
-        for r in long_countries[:3]:
-            print(f"  {repr(r.get('country_of_origin','')[:80])}")
+        for value in long_countries[:3]:
+            print(f"  {repr(value[:80])}")
 
 
-def sample_values(rows: list[dict], field: str, n: int = 15):
+def sample_values(rows: pd.DataFrame, field: str, n: int = 15):
     print(f"\n{'='*70}")
     print(f"Sample values: {field}")
     print(f"{'='*70}")
 
-    filled = [r for r in rows if r.get(field, "").strip()]
-    if not filled:
+    positions = np.flatnonzero(_filled(rows, field).to_numpy())
+    if not len(positions):
         print("  (no values)")
         return
 
     import random
     random.seed(42)
-    sample = random.sample(filled, min(n, len(filled)))
+    # random.sample's picks depend only on the population size, so sampling
+    # indices into the filled positions selects the same rows as sampling a
+    # list of filled row dicts, without copying the filled rows first.
+    picks = random.sample(range(len(positions)), min(n, len(positions)))
+    sample = rows.iloc[positions[picks]]
 
-    for r in sample:
-        print(f"  [{r.get('court_code','?')}] {r.get('citation','?'):35s} → {repr(r.get(field,'')[:80])}")
+    court_codes = sample["court_code"] if "court_code" in sample.columns else ["?"] * len(sample)
+    citations = sample["citation"] if "citation" in sample.columns else ["?"] * len(sample)
+    for court, citation, value in zip(court_codes, citations, sample[field]):
+        print(f"  [{court}] {citation:35s} → {repr(value[:80])}")
 
 
-def compare_to_baseline(current: list[dict], baseline_path: Path):
+def compare_to_baseline(current: pd.DataFrame, baseline_path: Path):
     baseline = load_csv(baseline_path)
-    baseline_map = {r["case_id"]: r for r in baseline if r.get("case_id")}
+    # Rows without a case_id never match (nor does any row of a baseline
+    # lacking the column); for duplicate ids the last row wins.
+    base_ids = _col(baseline, "case_id")
+    baseline = baseline.assign(case_id=base_ids)[base_ids != ""].drop_duplicates(
+        "case_id", keep="last"
+    )
+    base_fields = [f for f in STRUCTURED_FIELDS if f in baseline.columns]
+    merged = pd.DataFrame({"case_id": _col(current, "case_id")}).merge(
+        baseline[["case_id", *base_fields]], on="case_id", how="left"
+    ).fillna("")
 
     print(f"\n{'='*70}")
     print(f"Comparison: Current vs {baseline_path.name}")
@@ -166,26 +190,17 @@ def compare_to_baseline(current: list[dict], baseline_path: Path):
     improvements = 0
 
     for field in STRUCTURED_FIELDS:
-        if field not in current[0]:
+        if field not in current.columns:
             continue
 
-        prev_filled = sum(
-            1 for r in current
-            if baseline_map.get(r.get("case_id", ""), {}).get(field, "").strip()
-        )
-        curr_filled = sum(1 for r in current if r.get(field, "").strip())
-
-        # Check regressions (field was filled in baseline but empty now)
-        reg = 0
-        imp = 0
-        for r in current:
-            cid = r.get("case_id", "")
-            baseline_val = baseline_map.get(cid, {}).get(field, "")
-            curr_val = r.get(field, "")
-            if baseline_val.strip() and not curr_val.strip():
-                reg += 1
-            elif not baseline_val.strip() and curr_val.strip():
-                imp += 1
+        was_filled = _filled(merged, field).to_numpy()
+        is_filled = _filled(current, field).to_numpy()
+        prev_filled = int(was_filled.sum())
+        curr_filled = int(is_filled.sum())
+
+        # Regressions: filled in baseline but empty now; improvements: the reverse.
+        reg = int((was_filled & ~is_filled).sum())
+        imp = int((~was_filled & is_filled).sum())
 
         regressions += reg
         improvements += imp
@@ -218,7 +233,7 @@ def main():
     else:
         # Sample key fields
         for field in ["country_of_origin", "is_represented", "visa_outcome_reason", "legal_test_applied"]:
-            if field in rows[0]:
+            if field in rows.columns:
                 sample_values(rows, field, n=8)
 
     if args.compare_to:
@@ -44,8 +44,6 @@ if os.environ.get("APP_ENV") == "production":
 
     _socket.getaddrinfo = _cf_dns_patch
 
-from immi_case_downloader.webapp import create_app
-
 
 def _get_env_default_port() -> int:
     """Read backend port from environment with safe fallback."""
@@ -107,9 +105,15 @@ def main():
             stacklevel=1,
         )
 
+    # Imported only once the arguments are valid, so --help and usage errors
+    # exit without loading Flask and the app package.
+    from immi_case_downloader.webapp import create_app
+
     app = create_app(output_dir=args.output, backend=args.backend)
-    print(f"Starting IMMI-Case web interface at http://{args.host}:{args.port}")
-    print(f"Data directory: {args.output}")
+    print(
+        f"Starting IMMI-Case web interface at http://{args.host}:{args.port}\n"
+        f"Data directory: {args.output}"
+    )
     app.run(host=args.host, port=args.port, debug=args.debug)
 
 